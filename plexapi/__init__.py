@@ -1,11 +1,10 @@
 # -*- coding: utf-8 -*-
 import logging
 import os
+import sys
 from logging.handlers import RotatingFileHandler
-from platform import uname
 from plexapi.config import PlexConfig, reset_base_headers
 from plexapi.utils import SecretsFilter
-from uuid import getnode
 
 # Load User Defined Config
 DEFAULT_CONFIG_PATH = os.path.expanduser('~/.config/plexapi/config.ini')
@@ -20,14 +19,43 @@ X_PLEX_CONTAINER_SIZE = CONFIG.get('plexapi.container_size', 50, int)
 
 # Plex Header Configuation
 X_PLEX_PROVIDES = CONFIG.get('header.provides', 'controller')
-X_PLEX_PLATFORM = CONFIG.get('header.platorm', uname()[0])
-X_PLEX_PLATFORM_VERSION = CONFIG.get('header.platform_version', uname()[2])
 X_PLEX_PRODUCT = CONFIG.get('header.product', PROJECT)
 X_PLEX_VERSION = CONFIG.get('header.version', VERSION)
-X_PLEX_DEVICE = CONFIG.get('header.device', X_PLEX_PLATFORM)
-X_PLEX_DEVICE_NAME = CONFIG.get('header.device_name', uname()[1])
-X_PLEX_IDENTIFIER = CONFIG.get('header.identifier', str(hex(getnode())))
-BASE_HEADERS = reset_base_headers()
+
+
+def _uname(index):
+    from platform import uname
+    return uname()[index]
+
+
+def _getnode():
+    from uuid import getnode
+    return str(hex(getnode()))
+
+
+# Headers derived from uname() and getnode() (which can be slow or fork a subprocess on some
+# systems) are computed on first access rather than at import, see __getattr__ below.
+_LAZY = (
+    ('X_PLEX_PLATFORM', lambda: CONFIG.get('header.platorm') or _uname(0)),
+    ('X_PLEX_PLATFORM_VERSION', lambda: CONFIG.get('header.platform_version') or _uname(2)),
+    ('X_PLEX_DEVICE', lambda: CONFIG.get('header.device') or getattr(sys.modules[__name__], 'X_PLEX_PLATFORM')),
+    ('X_PLEX_DEVICE_NAME', lambda: CONFIG.get('header.device_name') or _uname(1)),
+    ('X_PLEX_IDENTIFIER', lambda: CONFIG.get('header.identifier') or _getnode()),
+    ('BASE_HEADERS', reset_base_headers),
+)
+
+
+def __getattr__(name):
+    for attr, func in _LAZY:
+        if attr == name:
+            globals()[name] = func()
+            return globals()[name]
+    raise AttributeError("module 'plexapi' has no attribute '%s'" % name)
+
+
+if sys.version_info < (3, 7):  # module __getattr__ not supported
+    for _attr, _func in _LAZY:
+        globals()[_attr] = _func()
 
 # Logging Configuration
 log = logging.getLogger('plexapi')
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+# Requires Python 3.5+ and aiohttp (pip install aiohttp)
+from requests.status_codes import _codes as codes
+from plexapi import CONFIG, TIMEOUT
+from plexapi import log, logfilter, utils
+from plexapi.base import PlexObject
+from plexapi.compat import urlencode
+from plexapi.exceptions import BadRequest, NotFound, Unsupported
+from plexapi.library import Hub
+from plexapi.server import PlexServer
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+class AsyncPlexServer(PlexObject):
+    """ Asyncio counterpart of :class:`~plexapi.server.PlexServer`. Requests are made with
+        aiohttp, so a single event loop can drive many concurrent requests (to one or many
+        servers) without a thread per request. Responses are parsed by the same
+        ``_loadData`` implementations and PLEXOBJECTS registry as the blocking API, so the
+        :class:`~plexapi.video.Movie`, :class:`~plexapi.audio.Track`, etc. objects returned
+        are identical to the ones returned by PlexServer.
+
+        Objects built by this server are bound to a blocking :class:`~plexapi.server.PlexServer`
+        sharing the same baseurl, token and root data (available as ``server.plex``). This
+        keeps the regular item methods and automatic partial object reloads working, but
+        those calls are blocking; use the coroutines on this class from within the event loop.
+
+        Example:
+
+            .. code-block:: python
+
+                async with AsyncPlexServer(baseurl, token) as plex:
+                    sessions, history = await asyncio.gather(plex.sessions(), plex.history())
+
+        Parameters:
+            baseurl (str): Base url for to access the Plex Media Server (default: 'http://localhost:32400').
+            token (str): Required Plex authentication token to access the server.
+            session (aiohttp.ClientSession, optional): Use your own session object if you want to
+                share the connection pool across several servers. A session is created (and
+                closed with the server) if not specified.
+            timeout (int): timeout in seconds on initial connect to server (default config.TIMEOUT).
+            keep_xml (bool): Set False to drop the XML items were built from, see
+                :class:`~plexapi.server.PlexServer`.
+
+        Raises:
+            :class:`~plexapi.exceptions.Unsupported`: aiohttp not installed.
+    """
+    key = '/'
+
+    _headers = PlexServer._headers
+    url = PlexServer.url
+
+    def __init__(self, baseurl=None, token=None, session=None, timeout=None, keep_xml=True):
+        if aiohttp is None:
+            raise Unsupported('AsyncPlexServer requires aiohttp: pip install aiohttp')
+        self._baseurl = baseurl or CONFIG.get('auth.server_baseurl', 'http://localhost:32400')
+        self._token = logfilter.add_secret(token or CONFIG.get('auth.server_token'))
+        self._session = session
+        self._closeSession = session is None
+        self._timeout = timeout
+        self._keepXml = keep_xml
+        self._server = None    # blocking PlexServer built items are bound to
+        self._data = None
+        self._initpath = self.key
+
+    async def __aenter__(self):
+        return await self.connect()
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def _loadData(self, data):
+        """ Load attribute values from Plex XML response. """
+        PlexServer._loadData(self, data)
+        self._server = _blockingServer(self, data)
+
+    @property
+    def plex(self):
+        """ Blocking :class:`~plexapi.server.PlexServer` sharing this servers connection details.
+            Only available after :func:`~plexapi.aio.AsyncPlexServer.connect()`.
+        """
+        return self._server
+
+    async def connect(self):
+        """ Fetch and load the root attributes of this server. Returns self. """
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        data = await self.query(self.key, timeout=self._timeout)
+        self._loadData(data)
+        return self
+
+    async def close(self):
+        """ Close the aiohttp session if it was created by this server. """
+        if self._session is not None and self._closeSession:
+            await self._session.close()
+            self._session = None
+
+    async def query(self, key, method=None, headers=None, timeout=None, **kwargs):
+        """ Coroutine version of :func:`~plexapi.server.PlexServer.query()`. Returns the
+            parsed ElementTree object or None if no data exists in the response.
+        """
+        url = self.url(key)
+        method = method or self._session.get
+        timeout = aiohttp.ClientTimeout(total=timeout or TIMEOUT)
+        log.debug('%s %s', method.__name__.upper(), url)
+        headers = self._headers(**headers or {})
+        async with method(url, headers=headers, timeout=timeout, **kwargs) as response:
+            data = await response.read()
+            if response.status not in (200, 201):
+                codename = codes.get(response.status)[0]
+                errtext = data.decode('utf8', 'replace').replace('\n', ' ')
+                log.warning('BadRequest (%s) %s %s; %s' % (response.status, codename, response.url, errtext))
+                raise BadRequest('(%s) %s; %s %s' % (response.status, codename, response.url, errtext))
+        return utils.parseXml(data)
+
+    async def fetchItem(self, ekey, cls=None, keep_xml=None, **kwargs):
+        """ Coroutine version of :func:`~plexapi.base.PlexObject.fetchItem()`. """
+        if isinstance(ekey, int):
+            ekey = '/library/metadata/%s' % ekey
+        check = self._compileFilter(**kwargs)
+        for elem in await self.query(ekey):
+            if check(elem):
+                item = self._buildItem(elem, cls, ekey)
+                return item if self._keepData(keep_xml) else item._releaseData()
+        clsname = cls.__name__ if cls else 'None'
+        raise NotFound('Unable to find elem: cls=%s, attrs=%s' % (clsname, kwargs))
+
+    async def fetchItems(self, ekey, cls=None, keep_xml=None, **kwargs):
+        """ Coroutine version of :func:`~plexapi.base.PlexObject.fetchItems()`. """
+        data = await self.query(ekey)
+        return self.findItems(data, cls, ekey, keep_xml, **kwargs)
+
+    async def history(self):
+        """ Returns a list of media items from watched history. """
+        return await self.fetchItems('/status/sessions/history/all')
+
+    async def search(self, query, mediatype=None, limit=None):
+        """ Coroutine version of :func:`~plexapi.server.PlexServer.search()`. """
+        results = []
+        params = {'query': query}
+        if mediatype:
+            params['section'] = utils.SEARCHTYPES[mediatype]
+        if limit:
+            params['limit'] = limit
+        key = '/hubs/search?%s' % urlencode(params)
+        for hub in await self.fetchItems(key, Hub):
+            results += hub.items
+        return results
+
+    async def sessions(self):
+        """ Returns a list of all active session (currently playing) media objects. """
+        return await self.fetchItems('/status/sessions')
+
+
+def _blockingServer(aserver, data):
+    """ Returns a blocking :class:`~plexapi.server.PlexServer` built from the root data
+        already fetched by the specified AsyncPlexServer, without making a request.
+    """
+    server = PlexServer(aserver._baseurl, aserver._token, lazy=True, keep_xml=aserver._keepXml)
+    server._loadData(data)
+    return server
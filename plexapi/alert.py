@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 import json
 import threading
-import websocket
 from plexapi import log
 
 
@@ -28,6 +27,7 @@ class AlertListener(threading.Thread):
         self._ws = None
 
     def run(self):
+        import websocket
         # create the websocket connection
         url = self._server.url(self.key).replace('http', 'ws')
         log.info('Starting AlertListener: %s', url)
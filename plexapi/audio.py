@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
-from plexapi import media, utils
-from plexapi.base import Playable, PlexPartialObject
+from plexapi import utils
+import plexapi.media  # noqa: F401 (registers the Media, MediaPart and tag objects)
+from plexapi.base import Attr, Items, Playable, PlexPartialObject
 
 
 class Audio(PlexPartialObject):
@@ -23,23 +24,24 @@ class Audio(PlexPartialObject):
             updatedAt (datatime): Datetime this item was updated.
             viewCount (int): Count of times this item was accessed.
     """
+    listType = 'audio'
+    addedAt = Attr(utils.toDatetime)
+    index = Attr()
+    lastViewedAt = Attr(utils.toDatetime)
+    librarySectionID = Attr()
+    ratingKey = Attr(int)
+    summary = Attr()
+    thumb = Attr()
+    title = Attr()
+    type = Attr()
+    updatedAt = Attr(utils.toDatetime)
+    viewCount = Attr(int, default=0)
+
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
         self._data = data
-        self.listType = 'audio'
-        self.addedAt = utils.toDatetime(data.attrib.get('addedAt'))
-        self.index = data.attrib.get('index')
         self.key = data.attrib.get('key')
-        self.lastViewedAt = utils.toDatetime(data.attrib.get('lastViewedAt'))
-        self.librarySectionID = data.attrib.get('librarySectionID')
-        self.ratingKey = utils.cast(int, data.attrib.get('ratingKey'))
-        self.summary = data.attrib.get('summary')
-        self.thumb = data.attrib.get('thumb')
-        self.title = data.attrib.get('title')
-        self.titleSort = data.attrib.get('titleSort', self.title)
-        self.type = data.attrib.get('type')
-        self.updatedAt = utils.toDatetime(data.attrib.get('updatedAt'))
-        self.viewCount = utils.cast(int, data.attrib.get('viewCount', 0))
+        self.titleSort = data.attrib.get('titleSort', data.attrib.get('title'))
 
     @property
     def thumbUrl(self):
@@ -65,6 +67,11 @@ class Artist(Audio):
     """
     TAG = 'Directory'
     TYPE = 'artist'
+    collections = Items('Collection')
+    countries = Items('Country')
+    genres = Items('Genre')
+    locations = Items('Location', 'path')
+    similar = Items('Similar')
 
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
@@ -72,11 +79,6 @@ class Artist(Audio):
         self.art = data.attrib.get('art')
         self.guid = data.attrib.get('guid')
         self.key = self.key.replace('/children', '')  # FIX_BUG_50
-        self.locations = self.listAttrs(data, 'path', etag='Location')
-        self.countries = self.findItems(data, media.Country)
-        self.genres = self.findItems(data, media.Genre)
-        self.similar = self.findItems(data, media.Similar)
-        self.collections = self.findItems(data, media.Collection)
 
     def __iter__(self):
         for album in self.albums():
@@ -154,6 +156,8 @@ class Album(Audio):
     """
     TAG = 'Directory'
     TYPE = 'album'
+    collections = Items('Collection')
+    genres = Items('Genre')
 
     def __iter__(self):
         for track in self.tracks:
@@ -171,8 +175,6 @@ class Album(Audio):
         self.parentTitle = data.attrib.get('parentTitle')
         self.studio = data.attrib.get('studio')
         self.year = utils.cast(int, data.attrib.get('year'))
-        self.genres = self.findItems(data, media.Genre)
-        self.collections = self.findItems(data, media.Collection)
 
     def track(self, title):
         """ Returns the :class:`~plexapi.audio.Track` that matches the specified title.
@@ -251,32 +253,32 @@ class Track(Audio, Playable):
     """
     TAG = 'Track'
     TYPE = 'track'
+    art = Attr()
+    chapterSource = Attr()
+    duration = Attr(int)
+    grandparentArt = Attr()
+    grandparentKey = Attr()
+    grandparentRatingKey = Attr()
+    grandparentThumb = Attr()
+    grandparentTitle = Attr()
+    guid = Attr()
+    originalTitle = Attr()
+    parentIndex = Attr()
+    parentKey = Attr()
+    parentRatingKey = Attr()
+    parentThumb = Attr()
+    parentTitle = Attr()
+    primaryExtraKey = Attr()
+    ratingCount = Attr(int)
+    viewOffset = Attr(int, default=0)
+    year = Attr(int)
+    media = Items('Media')
+    moods = Items('Mood')
 
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
         Audio._loadData(self, data)
         Playable._loadData(self, data)
-        self.art = data.attrib.get('art')
-        self.chapterSource = data.attrib.get('chapterSource')
-        self.duration = utils.cast(int, data.attrib.get('duration'))
-        self.grandparentArt = data.attrib.get('grandparentArt')
-        self.grandparentKey = data.attrib.get('grandparentKey')
-        self.grandparentRatingKey = data.attrib.get('grandparentRatingKey')
-        self.grandparentThumb = data.attrib.get('grandparentThumb')
-        self.grandparentTitle = data.attrib.get('grandparentTitle')
-        self.guid = data.attrib.get('guid')
-        self.originalTitle = data.attrib.get('originalTitle')
-        self.parentIndex = data.attrib.get('parentIndex')
-        self.parentKey = data.attrib.get('parentKey')
-        self.parentRatingKey = data.attrib.get('parentRatingKey')
-        self.parentThumb = data.attrib.get('parentThumb')
-        self.parentTitle = data.attrib.get('parentTitle')
-        self.primaryExtraKey = data.attrib.get('primaryExtraKey')
-        self.ratingCount = utils.cast(int, data.attrib.get('ratingCount'))
-        self.viewOffset = utils.cast(int, data.attrib.get('viewOffset', 0))
-        self.year = utils.cast(int, data.attrib.get('year'))
-        self.media = self.findItems(data, media.Media)
-        self.moods = self.findItems(data, media.Mood)
 
     def _prettyfilename(self):
         """ Returns a filename for use in download. """
@@ -1,9 +1,14 @@
 # -*- coding: utf-8 -*-
 import re
+import time
+from collections import deque
+from functools import partial
 
-from plexapi import log, utils
+from plexapi import X_PLEX_CONTAINER_SIZE, log, utils
 from plexapi.compat import quote_plus, urlencode
 from plexapi.exceptions import BadRequest, NotFound, UnknownType, Unsupported
+from plexapi.executor import cancel, getExecutor
+from plexapi.parser import Node
 from plexapi.utils import tag_helper
 
 OPERATORS = {
@@ -27,6 +32,171 @@ OPERATORS = {
 }
 
 
+def _filterOperator(attr):
+    """ Returns (attr, op, operator) for the filter attr[__op] (default exact). """
+    parts = attr.rsplit('__', 1)
+    if len(parts) == 2 and parts[1] in OPERATORS:
+        return parts[0], parts[1], OPERATORS[parts[1]]
+    return attr, 'exact', OPERATORS['exact']
+
+
+def _attrGetter(attrstr):
+    """ Returns a function returning the list of values of attrstr in an element. attrstr
+        is an attribute name (case-insensitive), etag for the element tag, or a path to the
+        attributes of children such as genre__tag.
+    """
+    attr, _, attrstr = attrstr.partition('__')
+    lower = attr.lower()
+    if attrstr:
+        getter = _attrGetter(attrstr)
+        return lambda elem: [v for child in elem if child.tag.lower() == lower for v in getter(child)]
+    if lower == 'etag':
+        return lambda elem: [elem.tag]
+
+    def getValues(elem):
+        value = elem.attrib.get(attr)
+        if value is not None:
+            return [value]
+        for _attr, value in elem.attrib.items():
+            if lower == _attr.lower():
+                return [value]
+        return []
+    return getValues
+
+
+def _attrCaster(op, query):
+    """ Returns the function casting attribute values to the type of query, or None. """
+    if op == 'exists':
+        return None
+    if isinstance(query, bool):
+        return lambda value: bool(int(value))
+    if isinstance(query, int):
+        return lambda value: float(value) if '.' in value else int(value)
+    if isinstance(query, float):
+        return float
+    return None
+
+
+def _pageKey(ekey, start, size):
+    """ Returns ekey requesting the page of size items from start of its container. """
+    return '%s%sX-Plex-Container-Start=%s&X-Plex-Container-Size=%s' % (ekey, '&' if '?' in ekey else '?', start, size)
+
+
+# Lazy attributes and Items declared on each class, by class - See _lazyAttrs() and _lazyItems()
+_LAZYATTRS = {}
+_LAZYITEMS = {}
+
+
+class Attr(object):
+    """ Declares an attribute of a :class:`~plexapi.base.PlexObject` read from the attribute of
+        the same name on its data element. Nothing is decoded while the object is built; the
+        value is decoded the first time the attribute is read and then stored on the object,
+        so reading it again costs no more than reading any other attribute. Values read before
+        the object is reloaded are refreshed from the new data.
+
+        Parameters:
+            cast (func): Function to decode the value. int, float and bool are cast with
+                :func:`~plexapi.utils.cast`, other functions (:func:`~plexapi.utils.toDatetime`,
+                :func:`~plexapi.utils.toList`, ..) are called with the value or None.
+            attr (str): Name of the data attribute, if not the name of this attribute.
+            default (str): Value to decode if the data attribute is missing (optional).
+    """
+    name = None
+
+    def __init__(self, cast=None, attr=None, default=None):
+        if cast in (int, float, bool):
+            cast = partial(utils.cast, cast)
+        self.cast = cast
+        self.attr = attr
+        self.default = default
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.attr = self.attr or name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if self.name is None:
+            _lazyAttrs(objtype)  # Python < 3.6 does not call __set_name__
+        data = obj.__dict__.get('_data')
+        if data is None:
+            return self.missing()
+        value = obj.__dict__[self.name] = self.decode(obj, data)
+        return value
+
+    def missing(self):
+        """ Returns the value of this attribute on objects without data. """
+        return None
+
+    def decode(self, obj, data):
+        """ Returns the value of this attribute decoded from data. """
+        value = data.attrib.get(self.attr, self.default)
+        return self.cast(value) if self.cast else value
+
+
+class Items(Attr):
+    """ Declares an attribute of a :class:`~plexapi.base.PlexObject` holding the list of objects
+        built from the child elements of its data element with the specified tag, or the list
+        of values of attr of those children. Like :class:`~plexapi.base.Attr`, the list is only
+        built the first time the attribute is read. The lists of all the Items declared on the
+        object are then built together, walking the children of the element once (see
+        :func:`~plexapi.base.PlexObject._decodeItems`).
+
+        Parameters:
+            etag (str): Tag of the child elements (Media, Genre, Stream, ..).
+            attr (str): Name of the attribute to list instead of building objects (optional).
+    """
+
+    def __init__(self, etag, attr=None):
+        super(Items, self).__init__(attr=attr)
+        self.etag = etag
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        data = obj.__dict__.get('_data')
+        if data is None:
+            return self.missing()
+        pending = [attr for name, attr in _lazyItems(objtype or obj.__class__) if name not in obj.__dict__]
+        obj.__dict__.update(obj._decodeItems(data, pending))
+        return obj.__dict__[self.name]
+
+    def missing(self):
+        return []
+
+    def decode(self, obj, data):
+        return obj._decodeItems(data, [self])[self.name]
+
+
+def _lazyAttrs(cls):
+    """ Returns a dict of the :class:`~plexapi.base.Attr` declared on cls and its bases, by name. """
+    attrs = _LAZYATTRS.get(cls)
+    if attrs is None:
+        attrs = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if isinstance(value, Attr):
+                    if value.name is None:
+                        value.__set_name__(klass, name)
+                    attrs[name] = value
+                else:
+                    attrs.pop(name, None)
+        _LAZYATTRS[cls] = attrs
+    return attrs
+
+
+def _lazyItems(cls):
+    """ Returns the (name, :class:`~plexapi.base.Items`) declared on cls and its bases. """
+    items = _LAZYITEMS.get(cls)
+    if items is None:
+        items = _LAZYITEMS[cls] = [(name, attr) for name, attr in _lazyAttrs(cls).items() if isinstance(attr, Items)]
+    return items
+
+
 class PlexObject(object):
     """ Base class for all Plex objects.
 
@@ -52,6 +222,9 @@ class PlexObject(object):
         return '<%s>' % ':'.join([p for p in [self.__class__.__name__, uid, name] if p])
 
     def __setattr__(self, attr, value):
+        # refresh the lazy attributes already read when reloaded from new data
+        if attr == '_data' and value is not None and '_data' in self.__dict__ and self._data is not value:
+            self._reloadAttrs(value)
         # dont overwrite an attr with None unless its a private variable
         if value is not None or attr.startswith('_') or attr not in self.__dict__:
             self.__dict__[attr] = value
@@ -67,16 +240,35 @@ class PlexObject(object):
         """ Factory function to build objects based on registered PLEXOBJECTS. """
         # cls is specified, build the object and return
         initpath = initpath or self._initpath
-        if cls is not None:
-            return cls(self._server, elem, initpath)
-        # cls is not specified, try looking it up in PLEXOBJECTS
-        etype = elem.attrib.get('type', elem.attrib.get('streamType'))
-        ehash = '%s.%s' % (elem.tag, etype) if etype else elem.tag
-        ecls = utils.PLEXOBJECTS.get(ehash, utils.PLEXOBJECTS.get(elem.tag))
-        # log.debug('Building %s as %s', elem.tag, ecls.__name__)
-        if ecls is not None:
-            return ecls(self._server, elem, initpath)
-        raise UnknownType("Unknown library type <%s type='%s'../>" % (elem.tag, etype))
+        if cls is None:
+            # cls is not specified, try looking it up in PLEXOBJECTS
+            etype = elem.attrib.get('type', elem.attrib.get('streamType'))
+            ehash = '%s.%s' % (elem.tag, etype) if etype else elem.tag
+            cls = utils.getPlexObject(ehash, elem.tag)
+            # log.debug('Building %s as %s', elem.tag, cls.__name__)
+            if cls is None:
+                raise UnknownType("Unknown library type <%s type='%s'../>" % (elem.tag, etype))
+        # share a single object per server between the items tagged with the same tag
+        internKey = cls._internKey(elem)
+        tags = getattr(self._server, '_tags', None)
+        if internKey is not None and tags is not None:
+            item = tags.get(internKey)
+            if item is None:
+                item = tags[internKey] = cls(self._server, elem, initpath)._releaseData()
+            return item
+        # merge into the existing object for this item if the server keeps an identity map
+        identityMap = getattr(self._server, '_identityMap', None)
+        if identityMap is not None and issubclass(cls, PlexPartialObject):
+            return identityMap.build(self._server, cls, elem, initpath)
+        return cls(self._server, elem, initpath)
+
+    @classmethod
+    def _internKey(cls, elem):
+        """ Returns the key identifying the object built from elem among the objects of its
+            server that are shared between items, or None if a new object is built each time
+            (the default). See :func:`~plexapi.media.MediaTag._internKey`.
+        """
+        return None
 
     def _buildItemOrNone(self, elem, cls=None, initpath=None):
         """ Calls :func:`~plexapi.base.PlexObject._buildItem()` but returns
@@ -87,7 +279,7 @@ class PlexObject(object):
         except UnknownType:
             return None
 
-    def fetchItem(self, ekey, cls=None, **kwargs):
+    def fetchItem(self, ekey, cls=None, keep_xml=None, **kwargs):
         """ Load the specified key to find and build the first item with the
             specified tag and attrs. If no tag or attrs are specified then
             the first item in the result set is returned.
@@ -100,6 +292,9 @@ class PlexObject(object):
                     items to be fetched, passing this in will help the parser ensure
                     it only returns those items. By default we convert the xml elements
                     with the best guess PlexObjects based on tag and type attrs.
+                keep_xml (bool): Set False to drop the XML the items were built from once they
+                    are built, see :func:`~plexapi.base.PlexObject._releaseData`. By default the
+                    keep_xml setting of the :class:`~plexapi.server.PlexServer` is used.
                 etag (str): Only fetch items with the specified tag.
                 **kwargs (dict): Optionally add attribute filters on the items to fetch. For
                     example, passing in viewCount=0 will only return matching items. Filtering
@@ -132,121 +327,311 @@ class PlexObject(object):
         """
         if isinstance(ekey, int):
             ekey = '/library/metadata/%s' % ekey
+        check = self._compileFilter(**kwargs)
         for elem in self._server.query(ekey):
-            if self._checkAttrs(elem, **kwargs):
-                return self._buildItem(elem, cls, ekey)
+            if check(elem):
+                item = self._buildItem(elem, cls, ekey)
+                return item if self._keepData(keep_xml) else item._releaseData()
         clsname = cls.__name__ if cls else 'None'
         raise NotFound('Unable to find elem: cls=%s, attrs=%s' % (clsname, kwargs))
 
-    def fetchItems(self, ekey, cls=None, **kwargs):
+    def fetchItems(self, ekey, cls=None, keep_xml=None, full=False, container_size=None, maxresults=None,
+            **kwargs):
         """ Load the specified key to find and build all items with the specified tag
             and attrs. See :func:`~plexapi.base.PlexObject.fetchItem` for more details
-            on how this is used.
+            on how this is used. Set full=True to reload the partial items returned in
+            bulk with :func:`~plexapi.server.PlexServer.hydrate`, rather than one request
+            per item the first time a missing attribute is read.
+
+            Set container_size or maxresults to read the container in pages of container_size
+            items rather than in a single response, see :func:`~plexapi.base.PlexObject._iterPages`.
+            Without container_size, the page size is adapted to the response times of the server
+            (see :attr:`~plexapi.server.PlexServer.containerSizer`). Only the first maxresults
+            matching items are returned.
         """
-        data = self._server.query(ekey)
-        return self.findItems(data, cls, ekey, **kwargs)
+        if container_size or maxresults is not None:
+            items = list(self._iterPagedItems(ekey, cls, keep_xml, container_size, maxresults, **kwargs))
+        else:
+            items = self.findItems(self._server.query(ekey), cls, ekey, keep_xml, **kwargs)
+        return self._server.hydrate(items) if full else items
 
-    def findItems(self, data, cls=None, initpath=None, **kwargs):
+    def findItems(self, data, cls=None, initpath=None, keep_xml=None, **kwargs):
         """ Load the specified data to find and build all items with the specified tag
             and attrs. See :func:`~plexapi.base.PlexObject.fetchItem` for more details
             on how this is used.
         """
+        return list(self._iterFoundItems(data, cls, initpath, keep_xml, **kwargs))
+
+    def iterItems(self, ekey, cls=None, keep_xml=None, container_size=None, maxresults=None, **kwargs):
+        """ Generator version of :func:`~plexapi.base.PlexObject.fetchItems`. The response is
+            streamed from the server and each matching item is built and yielded as soon as
+            its element has been parsed, so the first item arrives before the download
+            finishes and the full response is never held in memory. See
+            :func:`~plexapi.base.PlexObject.fetchItem` for details on the arguments.
+
+            With container_size or maxresults, the container is read in pages instead (see
+            :func:`~plexapi.base.PlexObject.fetchItems`) and the next page is requested while
+            the items of the current page are yielded. Closing the generator cancels the
+            requests not started yet.
+        """
+        if container_size or maxresults is not None:
+            return self._iterPagedItems(ekey, cls, keep_xml, container_size, maxresults, window=1, **kwargs)
+        return self._iterFoundItems(self._server.iterQuery(ekey), cls, ekey, keep_xml, **kwargs)
+
+    def _iterPagedItems(self, ekey, cls=None, keep_xml=None, container_size=None, maxresults=None, window=None,
+            **kwargs):
+        """ Yields the first maxresults items of ekey matching the specified tag and attrs,
+            read container_size items at a time with :func:`~plexapi.base.PlexObject._iterPages`.
+            Without container_size, the page size is chosen by the
+            :class:`~plexapi.paging.ContainerSizer` of the server (or config
+            plexapi.container_size if it has none). Used by fetchItems() and iterItems().
+        """
+        sizer = None if container_size else getattr(self._server, '_containerSizer', None)
+        size = container_size or (sizer.maxsize if sizer else X_PLEX_CONTAINER_SIZE)
+        if maxresults is not None:
+            size = min(size, maxresults)
+            if size < 1:
+                return
+        # without filters, the pages past maxresults are not requested at all
+        limit = maxresults if cls is None and not kwargs else None
+        pages = self._iterPages(ekey, size, limit, window, sizer)
+        count = 0
+        try:
+            for data in pages:
+                for item in self._iterFoundItems(data, cls, ekey, keep_xml, **kwargs):
+                    yield item
+                    count += 1
+                    if count == maxresults:
+                        return
+        finally:
+            pages.close()
+
+    def _iterPages(self, ekey, size, limit=None, window=None, sizer=None):
+        """ Yields the containers returned by ekey for each page of size items (requested with
+            X-Plex-Container-Start and X-Plex-Container-Size), up to limit items. The first page
+            gives the total size of the container; the next pages are then requested on the
+            executor, up to window pages (default max_workers) ahead of the page being yielded.
+            Closing the generator cancels the requests not started yet. If the server does not
+            return the total size, the pages are requested one at a time until a page is not
+            full (a container returned in full is not requested again). Paging stops at the
+            first page holding more items than requested, no items, or items from another
+            offset than requested, as returned by a server ignoring the paging headers.
+
+            With a :class:`~plexapi.paging.ContainerSizer`, each page is measured and requested
+            with the size chosen by the sizer at the time (at most size items).
+        """
+        pagesize = (lambda: min(size, sizer.size)) if sizer else (lambda: size)
+        start, count = 0, pagesize()
+        data = self._fetchPage(ekey, start, count, sizer)
+        total = utils.cast(int, data.attrib.get('totalSize')) if data is not None else None
+        if total is None:
+            while data is not None:
+                yield data
+                start += count
+                if len(data) != count or (limit is not None and start >= limit):
+                    return
+                count = pagesize()
+                data = self._fetchPage(ekey, start, count, sizer)
+            return
+        if len(data) > count:
+            yield data
+            return
+        executor, futures = getExecutor(), deque()
+        start, end = count, total if limit is None else min(total, limit)
+        try:
+            while True:
+                while start < end and len(futures) < (window or executor.max_workers):
+                    count = pagesize()
+                    futures.append((start, executor.submit(self._fetchPage, ekey, start, count, sizer)))
+                    start += count
+                if data is not None:
+                    yield data
+                if not futures:
+                    return
+                pagestart, future = futures.popleft()
+                data = future.result()
+                offset = utils.cast(int, data.attrib.get('offset', pagestart)) if data is not None else pagestart
+                if offset != pagestart or (data is not None and not len(data)):
+                    log.debug('Paging of %s stopped at %s, the page returned is empty or at another offset',
+                        ekey, pagestart)
+                    return
+        finally:
+            cancel(future for _, future in futures)
+
+    def _fetchPage(self, ekey, start, size, sizer=None):
+        """ Returns the container of the page of size items from start of ekey. With a sizer,
+            the response time and size are recorded with :func:`~plexapi.paging.ContainerSizer.update`.
+        """
+        key = _pageKey(ekey, start, size)
+        if sizer is None:
+            return self._server.query(key)
+        starttime = time.time()
+        data, nbytes = self._server._queryPage(key)
+        sizer.update(size, len(data) if data is not None else 0, nbytes, time.time() - starttime)
+        return data
+
+    def _iterFoundItems(self, data, cls=None, initpath=None, keep_xml=None, **kwargs):
+        """ Yields all items built from the elements in data that match the specified
+            tag and attrs. Used by findItems() and iterItems().
+        """
         # filter on cls attrs if specified
         if cls and cls.TAG and 'tag' not in kwargs:
             kwargs['etag'] = cls.TAG
         if cls and cls.TYPE and 'type' not in kwargs:
             kwargs['type'] = cls.TYPE
         # loop through all data elements to find matches
-        items = []
+        release = not self._keepData(keep_xml)
+        check = self._compileFilter(**kwargs)
         for elem in data:
-            if self._checkAttrs(elem, **kwargs):
+            if check(elem):
                 item = self._buildItemOrNone(elem, cls, initpath)
                 if item is not None:
-                    items.append(item)
-        return items
+                    yield item._releaseData() if release else item
+
+    def _keepData(self, keep_xml=None):
+        """ Returns keep_xml, or the keep_xml setting of the server if None. """
+        if keep_xml is None:
+            return getattr(self._server, '_keepXml', True)
+        return keep_xml
+
+    def _releaseData(self):
+        """ Decodes all attributes of this object and the objects built from it (media, parts,
+            tags, ..), then drops the XML elements they were built from so the response they
+            came from can be freed. Returns self. Used when keep_xml is False; the XML is
+            fetched again by :func:`~plexapi.base.PlexObject.reload`. Worth it when only some of
+            the items of a large response are kept.
+        """
+        data = self.__dict__.get('_data')
+        if data is None:
+            return self
+        # only values present in data are stored, the others read as None (or [])
+        attrs = [attr for name, attr in _lazyAttrs(self.__class__).items() if name not in self.__dict__]
+        for name, value in self._decodeLazy(data, attrs).items():
+            if value is not None and value != []:
+                self.__dict__[name] = value
+        self._data = None
+        self._released = True
+        for attr, value in list(self.__dict__.items()):
+            if not attr.startswith('_'):
+                for item in value if isinstance(value, list) else [value]:
+                    if isinstance(item, PlexObject):
+                        item._releaseData()
+        return self
 
     def firstAttr(self, *attrs):
         """ Return the first attribute in attrs that is not None. """
+        lazyattrs = _lazyAttrs(self.__class__)
         for attr in attrs:
             value = self.__dict__.get(attr)
+            if value is None and attr in lazyattrs:
+                value = lazyattrs[attr].__get__(self, self.__class__)
             if value is not None:
                 return value
 
-    def listAttrs(self, data, attr, **kwargs):
-        results = []
+    def _decodeAttrs(self):
+        """ Decodes all lazy attributes (see :class:`~plexapi.base.Attr`) not read yet. """
+        for name, attr in _lazyAttrs(self.__class__).items():
+            if name not in self.__dict__:
+                attr.__get__(self, self.__class__)
+
+    def _reloadAttrs(self, data):
+        # decoded lazy attributes are replaced with their value in data, keeping the
+        # current value if data does not include one (same as assigning them in _loadData)
+        attrs = [attr for name, attr in _lazyAttrs(self.__class__).items() if name in self.__dict__]
+        for name, value in self._decodeLazy(data, attrs).items():
+            if value is not None:
+                self.__dict__[name] = value
+
+    def _decodeLazy(self, data, attrs):
+        """ Returns the values of the lazy attributes attrs decoded from data, by name. """
+        values = self._decodeItems(data, [attr for attr in attrs if isinstance(attr, Items)])
+        for attr in attrs:
+            if not isinstance(attr, Items):
+                values[attr.name] = attr.decode(self, data)
+        return values
+
+    def _decodeItems(self, data, attrs):
+        """ Returns the lists of the :class:`~plexapi.base.Items` attrs built from the children
+            of data, by name. The children are walked once, each routed by its tag to the lists
+            declaring it, instead of filtering all of them again for each list.
+        """
+        values, routes = {}, {}
+        for attr in attrs:
+            values[attr.name] = []
+            routes.setdefault(attr.etag, []).append((attr.attr, values[attr.name]))
+        if not routes:
+            return values
+        release = not self._keepData()
         for elem in data:
-            kwargs['%s__exists' % attr] = True
-            if self._checkAttrs(elem, **kwargs):
-                results.append(elem.attrib.get(attr))
-        return results
+            for attr, items in routes.get(elem.tag, ()):
+                if attr:
+                    value = elem.attrib.get(attr)
+                    if value is not None:
+                        items.append(value)
+                    continue
+                item = self._buildItemOrNone(elem)
+                if item is not None:
+                    items.append(item._releaseData() if release else item)
+        return values
+
+    def listAttrs(self, data, attr, **kwargs):
+        kwargs['%s__exists' % attr] = True
+        check = self._compileFilter(**kwargs)
+        return [elem.attrib.get(attr) for elem in data if check(elem)]
 
     def reload(self, key=None):
         """ Reload the data for this object from self.key. """
         key = key or self.key
         if not key:
             raise Unsupported('Cannot reload an object not built from a URL.')
-        self._initpath = key
         data = self._server.query(key)
-        self._loadData(data[0])
+        return self._reloadFrom(key, data[0])
+
+    def _reloadFrom(self, key, elem):
+        """ Reload this object from elem, the data returned by key. Returns self. """
+        self._initpath = key
+        self._loadData(elem)
+        if self.__dict__.get('_released'):
+            self._releaseData()
         return self
 
     def _checkAttrs(self, elem, **kwargs):
-        attrsFound = {}
+        """ Returns True if elem matches the attribute filters in kwargs. To check many elements
+            compile the filters once with :func:`~plexapi.base.PlexObject._compileFilter`.
+        """
+        return self._compileFilter(**kwargs)(elem)
+
+    def _compileFilter(self, **kwargs):
+        """ Returns a function checking if an element matches the attribute filters in kwargs
+            (see :func:`~plexapi.base.PlexObject.fetchItem`). The operator, attribute path and
+            value cast of each filter are resolved once here rather than for every element.
+        """
+        tests = []
         for attr, query in kwargs.items():
-            attr, op, operator = self._getAttrOperator(attr)
-            values = self._getAttrValue(elem, attr)
+            attr, op, operator = _filterOperator(attr)
             # special case query in (None, 0, '') to include missing attr
-            if op == 'exact' and not values and query in (None, 0, ''):
-                return True
-            # return if attr were looking for is missing
-            attrsFound[attr] = False
-            for value in values:
-                value = self._castAttrValue(op, query, value)
-                if operator(value, query):
-                    attrsFound[attr] = True
-                    break
-        # log.debug('Checking %s for %s found: %s', elem.tag, kwargs, attrsFound)
-        return all(attrsFound.values())
-
-    def _getAttrOperator(self, attr):
-        for op, operator in OPERATORS.items():
-            if attr.endswith('__%s' % op):
-                attr = attr.rsplit('__', 1)[0]
-                return attr, op, operator
-        # default to exact match
-        return attr, 'exact', OPERATORS['exact']
-
-    def _getAttrValue(self, elem, attrstr, results=None):
-        # log.debug('Fetching %s in %s', attrstr, elem.tag)
-        parts = attrstr.split('__', 1)
-        attr = parts[0]
-        attrstr = parts[1] if len(parts) == 2 else None
-        if attrstr:
-            results = [] if results is None else results
-            for child in [c for c in elem if c.tag.lower() == attr.lower()]:
-                results += self._getAttrValue(child, attrstr, results)
-            return [r for r in results if r is not None]
-        # check were looking for the tag
-        if attr.lower() == 'etag':
-            return [elem.tag]
-        # loop through attrs so we can perform case-insensative match
-        for _attr, value in elem.attrib.items():
-            if attr.lower() == _attr.lower():
-                return [value]
-        return []
-
-    def _castAttrValue(self, op, query, value):
-        if op == 'exists':
-            return value
-        if isinstance(query, bool):
-            return bool(int(value))
-        if isinstance(query, int) and '.' in value:
-            return float(value)
-        if isinstance(query, int):
-            return int(value)
-        if isinstance(query, float):
-            return float(value)
-        return value
+            missing = op == 'exact' and query in (None, 0, '')
+            tests.append((attr, _attrGetter(attr), _attrCaster(op, query), operator, query, missing))
+        # a failed test decides the result unless a later test is on the same
+        # attr (it replaces the result) or may include missing attrs
+        final = [not any(t[0] == test[0] or t[5] for t in tests[i + 1:]) for i, test in enumerate(tests)]
+
+        def check(elem):
+            attrsFound = {}
+            for (attr, getter, cast, operator, query, missing), last in zip(tests, final):
+                values = getter(elem)
+                if missing and not values:
+                    return True
+                for value in values:
+                    if operator(cast(value) if cast else value, query):
+                        attrsFound[attr] = True
+                        break
+                else:
+                    if last:
+                        return False
+                    attrsFound[attr] = False
+            return all(attrsFound.values())
+        return check
 
     def _loadData(self, data):
         raise NotImplementedError('Abstract method not implemented.')
@@ -285,7 +670,7 @@ class PlexPartialObject(PlexObject):
         if self.isFullObject(): return value
         # Log warning that were reloading the object
         clsname = self.__class__.__name__
-        title = self.__dict__.get('title', self.__dict__.get('name'))
+        title = self.firstAttr('title', 'name')
         objname = "%s '%s'" % (clsname, title) if title else clsname
         log.warning("Reloading %s for attr '%s'" % (objname, attr))
         # Reload and return the value
@@ -324,6 +709,28 @@ class PlexPartialObject(PlexObject):
         """ Returns True if this is not a full object. """
         return not self.isFullObject()
 
+    def _mergeFrom(self, elem):
+        """ Merges the attributes of elem, newer partial data of this item (a listing entry),
+            into this object without downgrading it to a partial object: the attributes in elem
+            (viewCount, viewOffset, lastViewedAt, ..) replace the current ones, the others and
+            the children (media, tags, ..) are kept. Returns self. Used by
+            :class:`~plexapi.cache.IdentityMap`.
+        """
+        data = self.__dict__.get('_data')
+        if data is None:
+            # released object: all the declared attributes are decoded already
+            for name, attr in _lazyAttrs(self.__class__).items():
+                if not isinstance(attr, Items) and attr.attr in elem.attrib:
+                    self.__dict__[name] = attr.decode(self, elem)
+            return self
+        attrib = dict(data.attrib)
+        attrib.update(elem.attrib)
+        merged = Node(data.tag, attrib)
+        for child in data:
+            merged.append(child)
+        self._loadData(merged)
+        return self
+
     def edit(self, **kwargs):
         """ Edit an object.
 
@@ -447,14 +854,17 @@ class Playable(object):
             playlistItemID (int): Playlist item ID (only populated for :class:`~plexapi.playlist.Playlist` items).
     """
 
+    sessionKey = Attr(int)                          # session
+    usernames = Items('User', 'title')              # session
+    players = Items('Player')                       # session
+    transcodeSessions = Items('TranscodeSession')   # session
+    session = Items('Session')                      # session
+    viewedAt = Attr(utils.toDatetime)               # history
+    playlistItemID = Attr(int)                      # playlist
+
     def _loadData(self, data):
-        self.sessionKey = utils.cast(int, data.attrib.get('sessionKey'))            # session
-        self.usernames = self.listAttrs(data, 'title', etag='User')                 # session
-        self.players = self.findItems(data, etag='Player')                          # session
-        self.transcodeSessions = self.findItems(data, etag='TranscodeSession')      # session
-        self.session = self.findItems(data, etag='Session')                         # session
-        self.viewedAt = utils.toDatetime(data.attrib.get('viewedAt'))               # history
-        self.playlistItemID = utils.cast(int, data.attrib.get('playlistItemID'))    # playlist
+        # all attributes are declared above and decoded when first read
+        pass
 
     def getStreamURL(self, **params):
         """ Returns a stream url that may be used by external applications such as VLC.
@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import json
+import os
+import time
+import weakref
+from collections import OrderedDict
+from threading import Lock
+from plexapi import CONFIG, compat, log, utils
+from plexapi.parser import parseJson
+
+
+class ResponseCache(object):
+    """ Base class for response caches used by :func:`~plexapi.server.PlexServer.query()`.
+        When a cache is passed to :class:`~plexapi.server.PlexServer`, the ETag and
+        Last-Modified validators of each GET response are stored along with its data and sent
+        back as If-None-Match and If-Modified-Since on the next request for the same url. When
+        the server responds with 304 Not Modified, the cached data is returned instead of
+        transferring and parsing the response again. Subclasses implement the storage by
+        overriding :func:`_load()`, :func:`_save()` and :func:`clear()`.
+
+        Attributes:
+            hits (int): Number of requests answered from the cache (304 Not Modified).
+            misses (int): Number of cacheable requests the server answered with new data.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, url, format='xml'):
+        """ Returns a tuple (validators, data) for the specified url and response format or None
+            if not cached. Validators is a dict of the request headers to send (If-None-Match
+            and/or If-Modified-Since) and data the parsed ElementTree object.
+        """
+        with self._lock:
+            return self._load(url, format)
+
+    def set(self, url, response, data, format='xml'):
+        """ Stores the validators from the specified requests.Response and its parsed data.
+            Responses without an ETag or Last-Modified header are not stored. The responses
+            of a url in each format (xml or json) are cached separately.
+        """
+        validators = {}
+        if response.headers.get('ETag'):
+            validators['If-None-Match'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            validators['If-Modified-Since'] = response.headers['Last-Modified']
+        if validators:
+            with self._lock:
+                self._save(url, format, validators, response.content, data)
+
+    def hit(self):
+        with self._lock:
+            self.hits += 1
+
+    def miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def clear(self):
+        """ Remove all entries from the cache. """
+        raise NotImplementedError('Abstract method not implemented.')
+
+    def _load(self, url, format):
+        raise NotImplementedError('Abstract method not implemented.')
+
+    def _save(self, url, format, validators, content, data):
+        raise NotImplementedError('Abstract method not implemented.')
+
+
+class MemoryCache(ResponseCache):
+    """ In-memory least recently used response cache. Cached entries hold the parsed
+        ElementTree object, so a 304 response costs neither transfer nor parsing.
+
+        Parameters:
+            maxsize (int): Max number of responses to keep (default 128).
+    """
+
+    def __init__(self, maxsize=128):
+        super(MemoryCache, self).__init__()
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _load(self, url, format):
+        entry = self._entries.pop((format, url), None)
+        if entry is not None:
+            self._entries[(format, url)] = entry
+        return entry
+
+    def _save(self, url, format, validators, content, data):
+        self._entries.pop((format, url), None)
+        self._entries[(format, url)] = (validators, data)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+class DiskCache(ResponseCache):
+    """ On-disk response cache. The validators and raw response body of each url are
+        stored in a file within the specified directory, so the cache survives restarts.
+        The body is parsed again when used, but not transferred. Each file holds a line of
+        JSON (the validators) followed by the body as is, so reading the cache never runs
+        code from the files in the directory.
+
+        Parameters:
+            path (str): Directory to store the cached responses in (default
+                ~/.config/plexapi/cache).
+    """
+
+    def __init__(self, path=None):
+        super(DiskCache, self).__init__()
+        self.path = os.path.expanduser(path or '~/.config/plexapi/cache')
+        compat.makedirs(self.path, exist_ok=True)
+
+    def clear(self):
+        with self._lock:
+            for filename in os.listdir(self.path):
+                if filename.endswith('.cache'):
+                    os.remove(os.path.join(self.path, filename))
+
+    def _filepath(self, url, format):
+        key = '%s %s' % (format, url)
+        return os.path.join(self.path, '%s.cache' % hashlib.sha1(key.encode('utf8')).hexdigest())
+
+    def _load(self, url, format):
+        try:
+            with open(self._filepath(url, format), 'rb') as handle:
+                validators, content = handle.read().split(b'\n', 1)
+            parse = parseJson if format == 'json' else utils.parseXml
+            return json.loads(validators.decode('utf8')), parse(content)
+        except (IOError, OSError):
+            return None
+        except Exception as err:
+            log.warning('Ignoring unreadable cache entry for %s: %s', url, err)
+            return None
+
+    def _save(self, url, format, validators, content, data):
+        with open(self._filepath(url, format), 'wb') as handle:
+            handle.write(json.dumps(validators).encode('utf8') + b'\n' + content)
+
+
+class JsonFile(object):
+    """ Base class for the small json files plexapi persists between processes. The file is
+        created readable by the current user only, as it may hold access tokens.
+
+        Parameters:
+            path (str): Path of the json file.
+    """
+
+    def __init__(self, path):
+        self.path = os.path.expanduser(path)
+        self._lock = Lock()
+
+    def _read(self):
+        try:
+            with open(self.path) as handle:
+                return json.load(handle)
+        except (IOError, OSError):
+            return {}
+        except ValueError as err:
+            log.warning('Ignoring unreadable cache file %s: %s', self.path, err)
+            return {}
+
+    def _write(self, entries):
+        compat.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with os.fdopen(os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w') as handle:
+            json.dump(entries, handle, indent=2, sort_keys=True)
+
+
+class ConnectionCache(JsonFile):
+    """ Persistent cache of the connections chosen by :func:`~plexapi.myplex.MyPlexResource.connect()`
+        and :func:`~plexapi.myplex.MyPlexDevice.connect()`. The uri, token and measured latency of
+        the winning connection are stored in a json file keyed by the clientIdentifier of the
+        resource, so the next process can try that uri first rather than probing every
+        connection (see :func:`~plexapi.myplex.connectCached()`). Entries expire after ttl seconds.
+
+        Parameters:
+            path (str): Cache file (default config plexapi.connection_cache or
+                ~/.config/plexapi/connections.json).
+            ttl (int): Seconds entries are valid for; 0 disables the cache (default config
+                plexapi.connection_ttl or 86400).
+    """
+
+    def __init__(self, path=None, ttl=None):
+        super(ConnectionCache, self).__init__(path or CONFIG.get('plexapi.connection_cache',
+            '~/.config/plexapi/connections.json'))
+        self.ttl = ttl if ttl is not None else CONFIG.get('plexapi.connection_ttl', 86400, int)
+
+    def get(self, key):
+        """ Returns the cached entry dict (clientIdentifier, name, provides, uri, token, latency
+            and timestamp) for the specified clientIdentifier or name, or None if not cached
+            or expired.
+        """
+        if not self.ttl:
+            return None
+        with self._lock:
+            entries = self._read()
+        for entry in entries.values():
+            if key in (entry['clientIdentifier'], entry['name']) and entry['timestamp'] + self.ttl > time.time():
+                return entry
+
+    def set(self, clientIdentifier, name, provides, uri, token, latency):
+        """ Stores the connection chosen for the specified resource. """
+        if not self.ttl:
+            return
+        with self._lock:
+            entries = self._read()
+            entries[clientIdentifier] = dict(clientIdentifier=clientIdentifier, name=name, provides=provides,
+                uri=uri, token=token, latency=latency, timestamp=time.time())
+            self._write(entries)
+
+    def remove(self, clientIdentifier):
+        """ Removes the entry for the specified resource, if any. """
+        with self._lock:
+            entries = self._read()
+            if entries.pop(clientIdentifier, None) is not None:
+                self._write(entries)
+
+
+class ServerSnapshot(JsonFile):
+    """ Persistent snapshot of the root attributes of Plex servers, keyed by baseurl and
+        machineIdentifier. A lazy :class:`~plexapi.server.PlexServer` created with a snapshot
+        loads its root attributes from it without any request, then revalidates them in the
+        background (see the lazy parameter of PlexServer).
+
+        Parameters:
+            path (str): Snapshot file (default config plexapi.server_snapshot or
+                ~/.config/plexapi/servers.json).
+    """
+
+    def __init__(self, path=None):
+        super(ServerSnapshot, self).__init__(path or CONFIG.get('plexapi.server_snapshot',
+            '~/.config/plexapi/servers.json'))
+
+    def get(self, baseurl, machineIdentifier=None):
+        """ Returns the root attributes dict last stored for the specified baseurl or None.
+
+            Parameters:
+                baseurl (str): Base url of the server.
+                machineIdentifier (str, optional): Expected machineIdentifier of the server, None
+                    is returned if the snapshot was stored for a different server.
+        """
+        with self._lock:
+            entry = self._read().get(baseurl)
+        if not entry or (machineIdentifier and entry['machineIdentifier'] != machineIdentifier):
+            return None
+        return entry['attrib']
+
+    def set(self, baseurl, attrib):
+        """ Stores the specified root attributes dict for the specified baseurl. The stored
+            machineIdentifier is replaced if a different server now answers on baseurl.
+        """
+        with self._lock:
+            entries = self._read()
+            entries[baseurl] = dict(machineIdentifier=attrib.get('machineIdentifier'), attrib=attrib,
+                timestamp=time.time())
+            self._write(entries)
+
+
+class IdentityMap(object):
+    """ Weak-reference map of the items built by one or more :class:`~plexapi.server.PlexServer`
+        (see identity_map), so the same library item returned by different requests (onDeck,
+        search, hubs, ..) is a single object rather than one copy per request. When an item is
+        built again, its existing object is updated with the new data instead and returned; a
+        full object is not downgraded by partial data, the attributes of the partial data
+        (viewCount, viewOffset, ..) are merged into it instead. Reloading the item reloads it
+        for every holder. Items are only kept while referenced elsewhere.
+
+        Items carrying attributes of one occurrence of the item, such as history entries
+        (viewedAt), sessions (sessionKey) and playlist or play queue items, are never merged.
+    """
+    OCCURRENCE_ATTRS = ('historyKey', 'playlistItemID', 'playQueueItemID', 'sessionKey', 'viewedAt')
+
+    def __init__(self):
+        self._items = weakref.WeakValueDictionary()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def build(self, server, cls, elem, initpath):
+        """ Returns the item of class cls built from elem by server, merged into the existing
+            object for the same (machineIdentifier, ratingKey) if there is one.
+        """
+        ratingKey = elem.attrib.get('ratingKey')
+        if ratingKey is None or any(attr in elem.attrib for attr in self.OCCURRENCE_ATTRS):
+            return cls(server, elem, initpath)
+        key = (server.machineIdentifier, ratingKey)
+        with self._lock:
+            item = self._items.get(key)
+        if item is None or item.__class__ is not cls:
+            item = cls(server, elem, initpath)
+            with self._lock:
+                self._items[key] = item
+        elif item.isPartialObject() or initpath == item.key:
+            item._reloadFrom(initpath, elem)
+        else:
+            item._mergeFrom(elem)
+        return item
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
@@ -1,12 +1,10 @@
 # -*- coding: utf-8 -*-
 
-import requests
-
 from requests.status_codes import _codes as codes
-from plexapi import BASE_HEADERS, CONFIG, TIMEOUT
+import plexapi
+from plexapi import CONFIG, TIMEOUT
 from plexapi import log, logfilter, utils
 from plexapi.base import PlexObject
-from plexapi.compat import ElementTree
 from plexapi.exceptions import BadRequest, Unsupported
 from plexapi.playqueue import PlayQueue
 
@@ -66,7 +64,7 @@ class PlexClient(PlexObject):
         self._baseurl = baseurl.strip('/') if baseurl else None
         self._token = logfilter.add_secret(token)
         server_session = server._session if server else None
-        self._session = session or server_session or requests.Session()
+        self._session = session or server_session or utils.getSession()
         self._proxyThroughServer = False
         self._commandId = 0
         if not any([data, initpath, baseurl, token]):
@@ -124,7 +122,7 @@ class PlexClient(PlexObject):
 
     def _headers(self, **kwargs):
         """ Returns a dict of all default headers for Client requests. """
-        headers = BASE_HEADERS
+        headers = plexapi.BASE_HEADERS.copy()
         if self._token:
             headers['X-Plex-Token'] = self._token
         headers.update(kwargs)
@@ -148,8 +146,8 @@ class PlexClient(PlexObject):
 
     def query(self, path, method=None, headers=None, timeout=None, **kwargs):
         """ Main method used to handle HTTPS requests to the Plex client. This method helps
-            by encoding the response to utf-8 and parsing the returned XML into and
-            ElementTree object. Returns None if no data exists in the response.
+            by parsing the raw bytes of the returned XML into an ElementTree object. Returns
+            None if no data exists in the response.
         """
         url = self.url(path)
         method = method or self._session.get
@@ -162,8 +160,7 @@ class PlexClient(PlexObject):
             errtext = response.text.replace('\n', ' ')
             log.warning('BadRequest (%s) %s %s; %s' % (response.status_code, codename, response.url, errtext))
             raise BadRequest('(%s) %s; %s %s' % (response.status_code, codename, response.url, errtext))
-        data = response.text.encode('utf8')
-        return ElementTree.fromstring(data) if data.strip() else None
+        return utils.parseXml(response.content)
 
     def sendCommand(self, command, proxy=None, **params):
         """ Convenience wrapper around :func:`~plexapi.client.PlexClient.query()` to more easily
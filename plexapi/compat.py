@@ -13,6 +13,11 @@ try:
 except NameError:
     string_type = str
 
+try:
+    from sys import intern
+except ImportError:
+    intern = intern
+
 try:
     from urllib.parse import urlencode
 except ImportError:
@@ -33,6 +38,11 @@ try:
 except ImportError:
     from urllib import unquote
 
+try:
+    from queue import Queue
+except ImportError:
+    from Queue import Queue
+
 try:
     from configparser import ConfigParser
 except ImportError:
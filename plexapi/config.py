@@ -49,7 +49,10 @@ class PlexConfig(ConfigParser):
 
 
 def reset_base_headers():
-    """ Convenience function returns a dict of all base X-Plex-* headers for session requests. """
+    """ Convenience function returns a dict of all base X-Plex-* headers for session requests.
+        Also advertises gzip and deflate transfer compression, which the Plex Media Server
+        and plex.tv apply to large XML responses.
+    """
     import plexapi
     return {
         'X-Plex-Platform': plexapi.X_PLEX_PLATFORM,
@@ -60,4 +63,5 @@ def reset_base_headers():
         'X-Plex-Device': plexapi.X_PLEX_DEVICE,
         'X-Plex-Device-Name': plexapi.X_PLEX_DEVICE_NAME,
         'X-Plex-Client-Identifier': plexapi.X_PLEX_IDENTIFIER,
+        'Accept-Encoding': 'gzip, deflate',
     }
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+# Requires concurrent.futures (Python 3.2+ or pip install futures)
+from collections import deque
+from concurrent.futures import CancelledError, Future, TimeoutError, as_completed  # noqa: F401
+from itertools import islice
+from threading import Lock, Semaphore, Thread, local
+from plexapi import CONFIG, log
+from plexapi.compat import Queue
+
+# Library-wide executor - See getExecutor()
+_EXECUTOR = None
+_EXECUTOR_LOCK = Lock()
+
+
+class Executor(object):
+    """ Bounded thread pool used for all concurrent work done by plexapi (connecting to
+        resources, :func:`~plexapi.utils.threaded`, ..). However many tasks are submitted,
+        at most max_workers threads are started; the remaining tasks are queued.
+
+        Tasks submitted from within a task already running on this executor are run inline in
+        the calling thread. This keeps nested fan-out (a task that itself calls
+        :func:`~plexapi.utils.threaded`) from waiting on queued tasks that can never start
+        because all workers are busy waiting.
+
+        Workers are daemon threads started as needed, so a request that hangs (or an abandoned
+        task still running) never holds up the exit of the interpreter.
+
+        Parameters:
+            max_workers (int): Max number of worker threads (default config plexapi.max_workers or 16).
+    """
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or CONFIG.get('plexapi.max_workers', 16, int)
+        self._queue = Queue()
+        self._idle = Semaphore(0)
+        self._threads = []
+        self._lock = Lock()
+        self._shutdown = False
+        self._local = local()
+
+    def _worker(self):
+        self._local.worker = True
+        while True:
+            task = self._queue.get()
+            if task is None:
+                return
+            future, func, args, kwargs = task
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(func(*args, **kwargs))
+                except BaseException as err:
+                    future.set_exception(err)
+            del task, future
+            self._idle.release()
+
+    def _startWorker(self):
+        # reuse an idle worker if any, otherwise start a new one up to max_workers
+        if self._idle.acquire(False):
+            return
+        with self._lock:
+            if len(self._threads) < self.max_workers:
+                thread = Thread(target=self._worker, name='plexapi-%s' % (len(self._threads) + 1))
+                thread.daemon = True
+                thread.start()
+                self._threads.append(thread)
+
+    def submit(self, func, *args, **kwargs):
+        r""" Schedules func(\*args, \*\*kwargs) and returns a :class:`concurrent.futures.Future`
+            for its result. Calling ``future.cancel()`` removes a task that has not started yet.
+        """
+        if getattr(self._local, 'worker', False):
+            future = Future()
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(func(*args, **kwargs))
+            except Exception as err:
+                future.set_exception(err)
+            return future
+        if self._shutdown:
+            raise RuntimeError('Cannot schedule new tasks after shutdown')
+        future = Future()
+        self._queue.put((future, func, args, kwargs))
+        self._startWorker()
+        return future
+
+    def map(self, func, listargs, timeout=None):
+        r""" Returns the list of results of func(\*args) for each args in listargs, run
+            concurrently and returned in order. If a call raises, the tasks not started yet are
+            cancelled and the exception is raised.
+
+            Parameters:
+                func (func): Function to call.
+                listargs (list): List of lists; \*args to pass each call.
+                timeout (int): Max seconds to wait for each result (default None; wait forever).
+
+            Raises:
+                :class:`concurrent.futures.TimeoutError`: A result is not available within timeout.
+                    Tasks not started yet are cancelled, running tasks are abandoned.
+        """
+        futures = [self.submit(func, *args) for args in listargs]
+        try:
+            return [future.result(timeout) for future in futures]
+        except BaseException:
+            cancel(futures)
+            raise
+
+    def imap(self, func, listargs, window=None, timeout=None):
+        r""" Generator version of :func:`~plexapi.executor.Executor.map()`. Yields the results of
+            func(\*args) for each args in listargs in order, as they become available. Only
+            window calls are submitted ahead of the result being waited on, so listargs may be
+            long (or a generator) without queueing all of it at once. Closing the generator, or
+            a call raising, cancels the calls not started yet.
+
+            Parameters:
+                func (func): Function to call.
+                listargs (iterable): Iterable of lists; \*args to pass each call.
+                window (int): Max number of calls submitted at once (default max_workers).
+                timeout (int): Max seconds to wait for each result (default None; wait forever).
+        """
+        listargs = iter(listargs)
+        futures = deque(self.submit(func, *args) for args in islice(listargs, window or self.max_workers))
+        try:
+            while futures:
+                result = futures.popleft().result(timeout)
+                futures.extend(self.submit(func, *args) for args in islice(listargs, 1))
+                yield result
+        finally:
+            cancel(futures)
+
+    def shutdown(self, wait=True):
+        """ Stop accepting tasks and release the worker threads once the queued tasks are done. """
+        with self._lock:
+            self._shutdown = True
+            threads = list(self._threads)
+        for _ in threads:
+            self._queue.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+
+def cancel(futures):
+    """ Cancels the specified futures that have not started running. Returns the number of
+        futures cancelled. Running tasks can not be interrupted; their results are discarded.
+    """
+    cancelled = sum(1 for future in futures if future.cancel())
+    if cancelled:
+        log.debug('Cancelled %s pending tasks', cancelled)
+    return cancelled
+
+
+def spawn(func, *args, **kwargs):
+    r""" Runs func(\*args, \*\*kwargs) on a new daemon thread, outside of the library-wide
+        executor, and returns a :class:`concurrent.futures.Future` for its result. Used for
+        tasks which may be abandoned while still running (such as the connection attempts
+        raced by :func:`~plexapi.myplex.MyPlexResource.connect`), so they neither occupy the
+        workers of the executor nor hold up the exit of the interpreter.
+    """
+    future = Future()
+
+    def _run():
+        if future.set_running_or_notify_cancel():
+            try:
+                future.set_result(func(*args, **kwargs))
+            except BaseException as err:
+                future.set_exception(err)
+    thread = Thread(target=_run, name='plexapi-%s' % getattr(func, '__name__', 'task'))
+    thread.daemon = True
+    thread.start()
+    return future
+
+
+def getExecutor():
+    """ Returns the library-wide :class:`~plexapi.executor.Executor`, created on first use with
+        the config plexapi.max_workers.
+    """
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = Executor()
+        return _EXECUTOR
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
-from plexapi import X_PLEX_CONTAINER_SIZE, log, utils
+from itertools import islice
+from threading import Event
+from plexapi import log, utils
 from plexapi.base import PlexObject
-from plexapi.compat import unquote, urlencode, quote_plus
+from plexapi.compat import Queue, unquote, urlencode, quote_plus
 from plexapi.media import MediaTag
 from plexapi.exceptions import BadRequest, NotFound
+from plexapi.executor import cancel, getExecutor
 
 
 class Library(PlexObject):
@@ -64,23 +67,95 @@ class Library(PlexObject):
             self.sections()
         return self._sectionsByID[sectionID]
 
-    def all(self, **kwargs):
+    def all(self, interleave=False, window=None, **kwargs):
         """ Returns a list of all media from all library sections.
-            This may be a very large dataset to retrieve.
+            This may be a very large dataset to retrieve. The sections are fetched
+            concurrently, see :func:`~plexapi.library.Library.iterAll` for the parameters.
         """
-        items = []
-        for section in self.sections():
-            for item in section.all(**kwargs):
-                items.append(item)
-        return items
+        return list(self.iterAll(interleave, window, **kwargs))
 
-    def onDeck(self):
-        """ Returns a list of all media items on deck. """
-        return self.fetchItems('/library/onDeck')
+    def iterAll(self, interleave=False, window=None, **kwargs):
+        """ Generator version of :func:`~plexapi.library.Library.all`. The sections are fetched
+            concurrently on the executor, at most window sections at once. By default the items
+            are grouped by section in the order of :func:`~plexapi.library.Library.sections`;
+            the items of a section are yielded while the next sections are being fetched. With
+            interleave=True, the items of all the sections being fetched are yielded as soon as
+            they are received, whichever section they belong to.
 
-    def recentlyAdded(self):
-        """ Returns a list of all media items recently added. """
-        return self.fetchItems('/library/recentlyAdded')
+            A section that can not be fetched is logged and skipped, the items of the other
+            sections are still returned. Closing the generator cancels the sections not started
+            yet (and stops the running ones with interleave=True).
+
+            Parameters:
+                interleave (bool): Yield the items of the sections as they are received rather
+                    than grouped by section (default False).
+                window (int): Max number of sections fetched at once (default max_workers).
+                **kwargs (dict): Passed to :func:`~plexapi.library.LibrarySection.all` of each
+                    section; container_size or maxresults read each section in pages (see
+                    :func:`~plexapi.base.PlexObject.fetchItems`), maxresults is per section.
+        """
+        executor = getExecutor()
+        if not interleave:
+            listargs = ([section, kwargs] for section in self.sections())
+            for items in executor.imap(self._sectionItems, listargs, window):
+                for item in items:
+                    yield item
+            return
+        queue, stop, done = Queue(), Event(), object()
+        sections = iter(self.sections())
+        futures = []
+        try:
+            for section in islice(sections, window or executor.max_workers):
+                futures.append(executor.submit(self._queueSectionItems, section, kwargs, queue, stop, done))
+            running = len(futures)
+            while running:
+                item = queue.get()
+                if item is not done:
+                    yield item
+                    continue
+                running -= 1
+                for section in islice(sections, 1):
+                    futures.append(executor.submit(self._queueSectionItems, section, kwargs, queue, stop, done))
+                    running += 1
+        finally:
+            stop.set()
+            cancel(futures)
+
+    def _sectionItems(self, section, kwargs):
+        """ Returns the list of all items of section, or an empty list (logged) if the section
+            can not be fetched. Used by iterAll().
+        """
+        try:
+            return section.all(**kwargs)
+        except Exception as err:
+            log.warning('Unable to fetch the items of library section %s: %s', section.title, err)
+            return []
+
+    def _queueSectionItems(self, section, kwargs, queue, stop, done):
+        """ Puts each item of section into queue as it is received, until stop is set, then
+            puts done. Errors are logged. Used by iterAll() with interleave=True.
+        """
+        try:
+            for item in section.iterAll(**kwargs):
+                if stop.is_set():
+                    break
+                queue.put(item)
+        except Exception as err:
+            log.warning('Unable to fetch the items of library section %s: %s', section.title, err)
+        finally:
+            queue.put(done)
+
+    def onDeck(self, **kwargs):
+        """ Returns a list of all media items on deck. kwargs are passed to
+            :func:`~plexapi.base.PlexObject.fetchItems` (container_size, maxresults, ..).
+        """
+        return self.fetchItems('/library/onDeck', **kwargs)
+
+    def recentlyAdded(self, **kwargs):
+        """ Returns a list of all media items recently added. kwargs are passed to
+            :func:`~plexapi.base.PlexObject.fetchItems` (container_size, maxresults, ..).
+        """
+        return self.fetchItems('/library/recentlyAdded', **kwargs)
 
     def search(self, title=None, libtype=None, **kwargs):
         """ Searching within a library section is much more powerful. It seems certain
@@ -382,6 +457,13 @@ class LibrarySection(PlexObject):
         key = '/library/sections/%s/all' % self.key
         return self.fetchItems(key, **kwargs)
 
+    def iterAll(self, **kwargs):
+        """ Generator version of :func:`~plexapi.library.LibrarySection.all`, see
+            :func:`~plexapi.base.PlexObject.iterItems`.
+        """
+        key = '/library/sections/%s/all' % self.key
+        return self.iterItems(key, **kwargs)
+
     def onDeck(self):
         """ Returns a list of media items on deck from this library section. """
         key = '/library/sections/%s/onDeck' % self.key
@@ -458,9 +540,9 @@ class LibrarySection(PlexObject):
 
     def search(self, title=None, sort=None, maxresults=999999, libtype=None, **kwargs):
         """ Search the library. If there are many results, they will be fetched from the server
-            in batches of X_PLEX_CONTAINER_SIZE amounts. If you're only looking for the first <num>
-            results, it would be wise to set the maxresults option to that amount so this functions
-            doesn't iterate over all results on the server.
+            in batches sized by :attr:`~plexapi.server.PlexServer.containerSizer`. If you're only
+            looking for the first <num> results, it would be wise to set the maxresults option to
+            that amount so this functions doesn't iterate over all results on the server.
 
             Parameters:
                 title (str): General string query to search for (optional).
@@ -487,6 +569,21 @@ class LibrarySection(PlexObject):
                         * studio: List of studios to search within ([studio_or_key, ...]). [music]
                         * year: List of years to search within ([yyyy, ...]). [all]
         """
+        key = self._searchKey(title, sort, libtype, **kwargs)
+        return self.fetchItems(key, maxresults=maxresults)
+
+    def iterSearch(self, title=None, sort=None, maxresults=999999, libtype=None, **kwargs):
+        """ Generator version of :func:`~plexapi.library.LibrarySection.search()`. Items are
+            yielded as soon as the page they are on has been fetched, and the request for the
+            next page is sent while the items of the current page are being consumed. Breaking
+            out of the loop (or closing the generator) cancels the remaining requests. See
+            :func:`~plexapi.library.LibrarySection.search()` for the parameters.
+        """
+        key = self._searchKey(title, sort, libtype, **kwargs)
+        return self.iterItems(key, maxresults=maxresults)
+
+    def _searchKey(self, title=None, sort=None, libtype=None, **kwargs):
+        """ Returns the key of a search, see :func:`~plexapi.library.LibrarySection.search()`. """
         # cleanup the core arguments
         args = {}
         for category, value in kwargs.items():
@@ -497,16 +594,7 @@ class LibrarySection(PlexObject):
             args['sort'] = self._cleanSearchSort(sort)
         if libtype is not None:
             args['type'] = utils.searchType(libtype)
-        # iterate over the results
-        results, subresults = [], '_init'
-        args['X-Plex-Container-Start'] = 0
-        args['X-Plex-Container-Size'] = min(X_PLEX_CONTAINER_SIZE, maxresults)
-        while subresults and maxresults > len(results):
-            key = '/library/sections/%s/all%s' % (self.key, utils.joinArgs(args))
-            subresults = self.fetchItems(key)
-            results += subresults[:maxresults - len(results)]
-            args['X-Plex-Container-Start'] += args['X-Plex-Container-Size']
-        return results
+        return '/library/sections/%s/all%s' % (self.key, utils.joinArgs(args))
 
     def _cleanSearchFilter(self, category, value, libtype=None):
         # check a few things before we begin
@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 from plexapi import log, utils
-from plexapi.base import PlexObject
+from plexapi.base import Attr, Items, PlexObject
 from plexapi.exceptions import BadRequest
-from plexapi.utils import cast
+from plexapi.utils import cast, internStr
 
 
 @utils.registerPlexObject
@@ -32,25 +32,25 @@ class Media(PlexObject):
             parts (list<:class:`~plexapi.media.MediaPart`>): List of MediaParts in this video.
     """
     TAG = 'Media'
+    aspectRatio = Attr(float)
+    audioChannels = Attr(int)
+    audioCodec = Attr(internStr)
+    bitrate = Attr(int)
+    container = Attr(internStr)
+    duration = Attr(int)
+    height = Attr(int)
+    id = Attr(int)
+    has64bitOffsets = Attr(bool)
+    optimizedForStreaming = Attr(bool)
+    videoCodec = Attr(internStr)
+    videoFrameRate = Attr(internStr)
+    videoResolution = Attr(internStr)
+    width = Attr(int)
+    parts = Items('Part')
 
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
         self._data = data
-        self.aspectRatio = cast(float, data.attrib.get('aspectRatio'))
-        self.audioChannels = cast(int, data.attrib.get('audioChannels'))
-        self.audioCodec = data.attrib.get('audioCodec')
-        self.bitrate = cast(int, data.attrib.get('bitrate'))
-        self.container = data.attrib.get('container')
-        self.duration = cast(int, data.attrib.get('duration'))
-        self.height = cast(int, data.attrib.get('height'))
-        self.id = cast(int, data.attrib.get('id'))
-        self.has64bitOffsets = cast(bool, data.attrib.get('has64bitOffsets'))
-        self.optimizedForStreaming = cast(bool, data.attrib.get('optimizedForStreaming'))
-        self.videoCodec = data.attrib.get('videoCodec')
-        self.videoFrameRate = data.attrib.get('videoFrameRate')
-        self.videoResolution = data.attrib.get('videoResolution')
-        self.width = cast(int, data.attrib.get('width'))
-        self.parts = self.findItems(data, MediaPart)
 
     def delete(self):
         part = self._initpath + '/media/%s' % self.id
@@ -81,26 +81,18 @@ class MediaPart(PlexObject):
             streams (list<:class:`~plexapi.media.MediaPartStream`>): List of streams in this media part.
     """
     TAG = 'Part'
+    container = Attr(internStr)
+    duration = Attr(int)
+    file = Attr()
+    id = Attr(int)
+    indexes = Attr(internStr)
+    size = Attr(int)
+    streams = Items('Stream')  # built as Video, Audio or SubtitleStream by streamType
 
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
         self._data = data
-        self.container = data.attrib.get('container')
-        self.duration = cast(int, data.attrib.get('duration'))
-        self.file = data.attrib.get('file')
-        self.id = cast(int, data.attrib.get('id'))
-        self.indexes = data.attrib.get('indexes')
         self.key = data.attrib.get('key')
-        self.size = cast(int, data.attrib.get('size'))
-        self.streams = self._buildStreams(data)
-
-    def _buildStreams(self, data):
-        streams = []
-        for elem in data:
-            for cls in (VideoStream, AudioStream, SubtitleStream):
-                if elem.attrib.get('streamType') == str(cls.STREAMTYPE):
-                    streams.append(cls(self._server, elem, self._initpath))
-        return streams
 
     def videoStreams(self):
         """ Returns a list of :class:`~plexapi.media.VideoStream` objects in this MediaPart. """
@@ -133,19 +125,19 @@ class MediaPartStream(PlexObject):
                 2=:class:`~plexapi.media.AudioStream`, 3=:class:`~plexapi.media.SubtitleStream`).
             type (int): Alias for streamType.
     """
+    codec = Attr(internStr)
+    codecID = Attr(internStr)
+    id = Attr(int)
+    index = Attr(int, default='-1')
+    language = Attr(internStr)
+    languageCode = Attr(internStr)
+    selected = Attr(bool, default='0')
+    streamType = Attr(int)
+    type = Attr(int, 'streamType')
 
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
         self._data = data
-        self.codec = data.attrib.get('codec')
-        self.codecID = data.attrib.get('codecID')
-        self.id = cast(int, data.attrib.get('id'))
-        self.index = cast(int, data.attrib.get('index', '-1'))
-        self.language = data.attrib.get('language')
-        self.languageCode = data.attrib.get('languageCode')
-        self.selected = cast(bool, data.attrib.get('selected', '0'))
-        self.streamType = cast(int, data.attrib.get('streamType'))
-        self.type = cast(int, data.attrib.get('streamType'))
 
     @staticmethod
     def parse(server, data, initpath):
@@ -183,25 +175,22 @@ class VideoStream(MediaPartStream):
     TAG = 'Stream'
     STREAMTYPE = 1
 
-    def _loadData(self, data):
-        """ Load attribute values from Plex XML response. """
-        super(VideoStream, self)._loadData(data)
-        self.bitDepth = cast(int, data.attrib.get('bitDepth'))
-        self.bitrate = cast(int, data.attrib.get('bitrate'))
-        self.cabac = cast(int, data.attrib.get('cabac'))
-        self.chromaSubsampling = data.attrib.get('chromaSubsampling')
-        self.colorSpace = data.attrib.get('colorSpace')
-        self.duration = cast(int, data.attrib.get('duration'))
-        self.frameRate = cast(float, data.attrib.get('frameRate'))
-        self.frameRateMode = data.attrib.get('frameRateMode')
-        self.hasScallingMatrix = cast(bool, data.attrib.get('hasScallingMatrix'))
-        self.height = cast(int, data.attrib.get('height'))
-        self.level = cast(int, data.attrib.get('level'))
-        self.profile = data.attrib.get('profile')
-        self.refFrames = cast(int, data.attrib.get('refFrames'))
-        self.scanType = data.attrib.get('scanType')
-        self.title = data.attrib.get('title')
-        self.width = cast(int, data.attrib.get('width'))
+    bitDepth = Attr(int)
+    bitrate = Attr(int)
+    cabac = Attr(int)
+    chromaSubsampling = Attr(internStr)
+    colorSpace = Attr(internStr)
+    duration = Attr(int)
+    frameRate = Attr(float)
+    frameRateMode = Attr(internStr)
+    hasScallingMatrix = Attr(bool)
+    height = Attr(int)
+    level = Attr(int)
+    profile = Attr(internStr)
+    refFrames = Attr(int)
+    scanType = Attr(internStr)
+    title = Attr()
+    width = Attr(int)
 
 
 @utils.registerPlexObject
@@ -224,18 +213,15 @@ class AudioStream(MediaPartStream):
     TAG = 'Stream'
     STREAMTYPE = 2
 
-    def _loadData(self, data):
-        """ Load attribute values from Plex XML response. """
-        super(AudioStream, self)._loadData(data)
-        self.audioChannelLayout = data.attrib.get('audioChannelLayout')
-        self.bitDepth = cast(int, data.attrib.get('bitDepth'))
-        self.bitrate = cast(int, data.attrib.get('bitrate'))
-        self.bitrateMode = data.attrib.get('bitrateMode')
-        self.channels = cast(int, data.attrib.get('channels'))
-        self.dialogNorm = cast(int, data.attrib.get('dialogNorm'))
-        self.duration = cast(int, data.attrib.get('duration'))
-        self.samplingRate = cast(int, data.attrib.get('samplingRate'))
-        self.title = data.attrib.get('title')
+    audioChannelLayout = Attr(internStr)
+    bitDepth = Attr(int)
+    bitrate = Attr(int)
+    bitrateMode = Attr(internStr)
+    channels = Attr(int)
+    dialogNorm = Attr(int)
+    duration = Attr(int)
+    samplingRate = Attr(int)
+    title = Attr()
 
 
 @utils.registerPlexObject
@@ -252,12 +238,13 @@ class SubtitleStream(MediaPartStream):
     TAG = 'Stream'
     STREAMTYPE = 3
 
+    format = Attr(internStr)
+    title = Attr()
+
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
         super(SubtitleStream, self)._loadData(data)
-        self.format = data.attrib.get('format')
         self.key = data.attrib.get('key')
-        self.title = data.attrib.get('title')
 
 
 @utils.registerPlexObject
@@ -339,13 +326,27 @@ class MediaTag(PlexObject):
         self.tagType = cast(int, data.attrib.get('tagType'))
         self.thumb = data.attrib.get('thumb')
 
+    @classmethod
+    def _internKey(cls, elem):
+        """ Tags are built once per server and shared by all the items with the same tag, as
+            the same few genres, countries or people are repeated across a whole library. Only
+            tags with all the same attributes are shared, so attributes which depend on the item
+            (role, thumb, ..) are never lost. Tags from hub search results (which have a key)
+            and tags with neither id nor tag are not shared.
+        """
+        attrib = elem.attrib
+        if 'key' not in attrib and ('id' in attrib or 'tag' in attrib):
+            return (cls, tuple(sorted(attrib.items())))
+
     def items(self, *args, **kwargs):
         """ Return the list of items within this tag. This function is only applicable
             in search results from PlexServer :func:`~plexapi.server.PlexServer.search()`.
+            kwargs are passed to :func:`~plexapi.base.PlexObject.fetchItems` (container_size,
+            maxresults, ..).
         """
         if not self.key:
             raise BadRequest('Key is not defined for this tag: %s' % self.tag)
-        return self.fetchItems(self.key)
+        return self.fetchItems(self.key, **kwargs)
 
 
 @utils.registerPlexObject
@@ -1,14 +1,15 @@
 # -*- coding: utf-8 -*-
 import copy
-import requests
 import time
 from requests.status_codes import _codes as codes
-from plexapi import BASE_HEADERS, CONFIG, TIMEOUT
+import plexapi
+from plexapi import CONFIG, TIMEOUT
 from plexapi import log, logfilter, utils
 from plexapi.base import PlexObject
+from plexapi.cache import ConnectionCache
 from plexapi.exceptions import BadRequest, NotFound
+from plexapi.executor import as_completed, spawn
 from plexapi.client import PlexClient
-from plexapi.compat import ElementTree
 from plexapi.library import LibrarySection
 from plexapi.server import PlexServer
 from plexapi.utils import joinArgs
@@ -75,7 +76,7 @@ class MyPlexAccount(PlexObject):
 
     def __init__(self, username=None, password=None, token=None, session=None, timeout=None):
         self._token = token
-        self._session = session or requests.Session()
+        self._session = session or utils.getSession()
         data, initpath = self._signin(username, password, timeout)
         super(MyPlexAccount, self).__init__(self, data, initpath)
 
@@ -142,7 +143,7 @@ class MyPlexAccount(PlexObject):
         url = '%s%sX-Plex-Token=%s' % (url, delim, self._token)
         timeout = timeout or TIMEOUT
         log.debug('%s %s %s', method.__name__.upper(), url, kwargs.get('json', ''))
-        allheaders = BASE_HEADERS.copy()
+        allheaders = plexapi.BASE_HEADERS.copy()
         allheaders.update(headers or {})
         response = method(url, headers=allheaders, timeout=timeout, **kwargs)
         if response.status_code not in (200, 201, 204):
@@ -150,8 +151,7 @@ class MyPlexAccount(PlexObject):
             errtext = response.text.replace('\n', ' ')
             log.warn('BadRequest (%s) %s %s; %s' % (response.status_code, codename, response.url, errtext))
             raise BadRequest('(%s) %s %s; %s' % (response.status_code, codename, response.url, errtext))
-        data = response.text.encode('utf8')
-        return ElementTree.fromstring(data) if data.strip() else None
+        return utils.parseXml(response.content)
 
     def resource(self, name):
         """ Returns the :class:`~plexapi.myplex.MyPlexResource` that matches the name specified.
@@ -529,8 +529,10 @@ class MyPlexResource(PlexObject):
         """ Returns a new :class:`~server.PlexServer` or :class:`~client.PlexClient` object.
             Often times there is more than one address specified for a server or client.
             This function will prioritize local connections before remote and HTTPS before HTTP.
-            After trying to connect to all available addresses for this resource and
-            assuming at least one connection was successful, the PlexServer object is built and returned.
+            All available addresses for this resource are tried concurrently and the PlexServer
+            object is returned as soon as the most preferred address that works responds. The
+            chosen address is saved to the :class:`~plexapi.cache.ConnectionCache` and tried
+            first on the next call, falling back to trying all addresses if it fails.
 
             Parameters:
                 ssl (optional): Set True to only connect to HTTPS connections. Set False to
@@ -551,12 +553,20 @@ class MyPlexResource(PlexObject):
         if ssl is True: connections = https
         elif ssl is False: connections = http
         else: connections = https + http
+        cache = ConnectionCache()
+        cached = cache.get(self.clientIdentifier)
+        if cached and cached['uri'] in connections:
+            device = _connectCached(cache, cached, cls, timeout)
+            if device is not None:
+                return device
         # Try connecting to all known resource connections in parellel, but
         # only return the first server (in order) that provides a response.
-        listargs = [[cls, url, self.accessToken, timeout] for url in connections]
-        log.info('Testing %s resource connections..', len(listargs))
-        results = utils.threaded(_connect, listargs)
-        return _chooseConnection('Resource', self.name, results)
+        log.info('Testing %s resource connections..', len(connections))
+        starttime = time.time()
+        device = _raceConnections('Resource', self.name, cls, connections, self.accessToken, timeout)
+        cache.set(self.clientIdentifier, self.name, self.provides, device._baseurl, self.accessToken,
+            round(time.time() - starttime, 3))
+        return device
 
 
 class ResourceConnection(PlexObject):
@@ -640,17 +650,26 @@ class MyPlexDevice(PlexObject):
     def connect(self, timeout=None):
         """ Returns a new :class:`~plexapi.client.PlexClient` or :class:`~plexapi.server.PlexServer`
             Sometimes there is more than one address specified for a server or client.
-            After trying to connect to all available addresses for this client and assuming
-            at least one connection was successful, the PlexClient object is built and returned.
+            All available addresses for this device are tried concurrently and the PlexClient
+            object is returned as soon as the first address (in order) that works responds. As
+            for :func:`~plexapi.myplex.MyPlexResource.connect()`, the chosen address is cached.
 
             Raises:
                 :class:`~plexapi.exceptions.NotFound`: When unable to connect to any addresses for this device.
         """
         cls = PlexServer if 'server' in self.provides else PlexClient
-        listargs = [[cls, url, self.token, timeout] for url in self.connections]
-        log.info('Testing %s device connections..', len(listargs))
-        results = utils.threaded(_connect, listargs)
-        _chooseConnection('Device', self.name, results)
+        cache = ConnectionCache()
+        cached = cache.get(self.clientIdentifier)
+        if cached and cached['uri'] in self.connections:
+            device = _connectCached(cache, cached, cls, timeout)
+            if device is not None:
+                return device
+        log.info('Testing %s device connections..', len(self.connections))
+        starttime = time.time()
+        device = _raceConnections('Device', self.name, cls, self.connections, self.token, timeout)
+        cache.set(self.clientIdentifier, self.name, self.provides, device._baseurl, self.token,
+            round(time.time() - starttime, 3))
+        return device
 
     def delete(self):
         """ Remove this device from your account. """
@@ -673,15 +692,67 @@ def _connect(cls, url, token, timeout, results, i):
         results[i] = (url, token, None, runtime)
 
 
-def _chooseConnection(ctype, name, results):
-    """ Chooses the first (best) connection from the given _connect results. """
-    # At this point we have a list of result tuples containing (url, token, PlexServer, runtime)
-    # or (url, token, None, runtime) in the case a connection could not be established.
-    for url, token, result, runtime in results:
-        okerr = 'OK' if result else 'ERR'
-        log.info('%s connection %s (%ss): %s?X-Plex-Token=%s', ctype, okerr, runtime, url, token)
-    results = [r[2] for r in results if r and r[2] is not None]
-    if results:
-        log.info('Connecting to %s: %s?X-Plex-Token=%s', ctype, results[0]._baseurl, results[0]._token)
-        return results[0]
+def connectCached(name, timeout=None):
+    """ Returns a :class:`~plexapi.server.PlexServer` or :class:`~plexapi.client.PlexClient`
+        connected to the address last chosen for the resource or device with the specified
+        name or clientIdentifier, without contacting plex.tv or probing its other addresses.
+        Returns None if the connection is not cached (see :class:`~plexapi.cache.ConnectionCache`),
+        has expired or no longer works. Example:
+
+        .. code-block:: python
+
+            plex = connectCached('Server') or MyPlexAccount().resource('Server').connect()
+
+        Parameters:
+            name (str): Name or clientIdentifier of the resource.
+            timeout (int): Timeout in seconds to connect (default 5).
+    """
+    cache = ConnectionCache()
+    cached = cache.get(name)
+    if cached is None:
+        return None
+    cls = PlexServer if 'server' in (cached['provides'] or '') else PlexClient
+    return _connectCached(cache, cached, cls, timeout)
+
+
+def _connectCached(cache, cached, cls, timeout):
+    """ Connects to the cached entry. A cached address that fails is removed from the cache
+        and None returned. Without a timeout specified, gives up after 5 seconds rather than
+        TIMEOUT, as all addresses are tried afterwards.
+    """
+    starttime = time.time()
+    try:
+        device = cls(baseurl=cached['uri'], token=cached['token'], timeout=timeout or min(TIMEOUT, 5))
+        log.info('Connecting to cached %s (%.3fs): %s', cached['name'], time.time() - starttime, cached['uri'])
+        return device
+    except Exception as err:
+        log.info('Cached connection to %s failed: %s', cached['name'], err)
+        cache.remove(cached['clientIdentifier'])
+        return None
+
+
+def _raceConnections(ctype, name, cls, urls, token, timeout):
+    """ Connects to all urls concurrently and returns the connection to the first url (in order
+        of preference) that responds. A connection is returned as soon as all the urls before
+        it have failed, without waiting for slower lower-priority attempts (such as remote
+        addresses that never answer) to time out. Each attempt runs on its own daemon thread
+        (see :func:`~plexapi.executor.spawn`); the attempts still running are abandoned without
+        occupying the workers of the executor or holding up the exit of the interpreter.
+    """
+    results = [None] * len(urls)
+    futures = [spawn(_connect, cls, url, token, timeout, results, i) for i, url in enumerate(urls)]
+    best = 0
+    for _ in as_completed(futures):
+        # results[i] is (url, token, PlexServer, runtime) or (url, token, None, runtime)
+        # in the case a connection could not be established.
+        while best < len(urls) and futures[best].done():
+            url, token, result, runtime = results[best]
+            okerr = 'OK' if result else 'ERR'
+            log.info('%s connection %s (%ss): %s?X-Plex-Token=%s', ctype, okerr, runtime, url, token)
+            if result is not None:
+                log.info('Connecting to %s: %s?X-Plex-Token=%s', ctype, result._baseurl, result._token)
+                return result
+            best += 1
+        if best == len(urls):
+            break
     raise NotFound('Unable to connect to %s: %s' % (ctype.lower(), name))
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+from collections import deque, namedtuple
+from threading import Lock
+from plexapi import CONFIG, X_PLEX_CONTAINER_SIZE, log
+
+# Measurements of a page read by a paged fetch - See ContainerSizer.stats
+PageStats = namedtuple('PageStats', ['size', 'items', 'bytes', 'seconds', 'nextsize'])
+
+
+class ContainerSizer(object):
+    """ Chooses the number of items requested per page by the paged fetches of a server
+        (:func:`~plexapi.base.PlexObject.fetchItems` with maxresults, library searches, the
+        watch history, ..) that do not specify a container_size. Each page read is measured:
+        the transfer rate (bytes per second) of the server and the size of the items in the
+        page (bytes per item) give the number of items that can be read within the target
+        latency. The next pages are requested with that size, at most doubled or halved at
+        each page and kept within the configured bounds. Many items per page on a fast local
+        network, fewer over a slow relay where large pages would time out.
+
+        Parameters:
+            size (int): Initial page size (default config plexapi.container_size or 50).
+            minsize (int): Min page size (default config plexapi.container_size_min or 10).
+            maxsize (int): Max page size (default config plexapi.container_size_max or 1000).
+            latency (float): Target seconds per page (default config plexapi.container_latency or 1).
+
+        Attributes:
+            size (int): Page size of the next page requested.
+            stats (deque<:class:`~plexapi.paging.PageStats`>): Size requested, items and bytes
+                received, seconds taken and page size chosen next, for the last 100 pages.
+    """
+
+    def __init__(self, size=None, minsize=None, maxsize=None, latency=None):
+        self.minsize = minsize or CONFIG.get('plexapi.container_size_min', 10, int)
+        self.maxsize = maxsize or CONFIG.get('plexapi.container_size_max', 1000, int)
+        self.latency = latency or CONFIG.get('plexapi.container_latency', 1.0, float)
+        self.size = max(self.minsize, min(self.maxsize, size or X_PLEX_CONTAINER_SIZE))
+        self.stats = deque(maxlen=100)
+        self._rate = None
+        self._lock = Lock()
+
+    def update(self, size, items, nbytes, seconds):
+        """ Records a page of size items requested, holding items items in nbytes bytes and
+            read in seconds. Returns the page size to request next.
+        """
+        with self._lock:
+            nextsize = self.size
+            if items and nbytes and seconds > 0:
+                # transfer rate averaged over the pages, bytes per item from this page
+                rate = nbytes / float(seconds)
+                self._rate = rate if self._rate is None else (self._rate + rate) / 2.0
+                target = self.latency * self._rate * items / float(nbytes)
+                nextsize = int(max(self.size / 2.0, min(self.size * 2.0, target)))
+                nextsize = max(self.minsize, min(self.maxsize, nextsize))
+            self.stats.append(PageStats(size, items, nbytes, seconds, nextsize))
+            if nextsize != self.size:
+                log.debug('Container size %s -> %s (%s items, %s bytes in %.3fs)',
+                    self.size, nextsize, items, nbytes, seconds)
+            self.size = nextsize
+            return nextsize
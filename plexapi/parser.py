@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+import json
+from xml.parsers import expat
+from plexapi import compat
+from plexapi.compat import ElementTree
+from plexapi.exceptions import Unsupported
+
+# Selected parser instance - See getParser()
+_PARSER = None
+
+
+class ElementTreeParser(object):
+    """ Parser backend using the standard library :mod:`xml.etree.ElementTree`. """
+    name = 'etree'
+    ParseError = ElementTree.ParseError
+
+    def fromstring(self, data):
+        """ Returns the root element parsed from the specified bytes. """
+        return ElementTree.fromstring(data)
+
+    def iterparse(self, source):
+        """ Returns an iterator of (event, element) tuples for the 'start' and 'end' events
+            of each element read from the specified file-like object.
+        """
+        return ElementTree.iterparse(source, events=('start', 'end'))
+
+
+class LxmlParser(object):
+    """ Parser backend using lxml, which parses large responses faster than the standard
+        library. Entities are never resolved. Opt-in (see :func:`~plexapi.parser.setParser`):
+        the objects built from lxml elements can not be pickled, and an element kept by an
+        object keeps its whole document alive.
+
+        Raises:
+            :class:`~plexapi.exceptions.Unsupported`: lxml not installed.
+    """
+    name = 'lxml'
+
+    def __init__(self):
+        try:
+            from lxml import etree
+        except ImportError:
+            raise Unsupported('The lxml parser requires lxml: pip install lxml')
+        self._lxml = etree
+        self.ParseError = etree.XMLSyntaxError
+        self._parser = etree.XMLParser(resolve_entities=False, huge_tree=True)
+
+    def fromstring(self, data):
+        return self._lxml.fromstring(data, self._parser)
+
+    def iterparse(self, source):
+        return self._lxml.iterparse(source, events=('start', 'end'), resolve_entities=False, huge_tree=True)
+
+
+class Node(object):
+    """ Minimal element built by :class:`~plexapi.parser.ExpatParser`. Implements the subset of
+        the ElementTree element interface read by the object model: the tag, the attrib dict,
+        :func:`get()`, iterating and indexing children, :func:`find()`, :func:`findall()`
+        and :func:`iter()`. Text content is not kept.
+    """
+    __slots__ = ('tag', 'attrib', '_children')
+
+    def __init__(self, tag, attrib):
+        self.tag = tag
+        self.attrib = attrib
+        self._children = []
+
+    def __repr__(self):
+        return '<Node %s at 0x%x>' % (self.tag, id(self))
+
+    def __iter__(self):
+        return iter(self._children)
+
+    def __len__(self):
+        return len(self._children)
+
+    def __getitem__(self, index):
+        return self._children[index]
+
+    def get(self, key, default=None):
+        return self.attrib.get(key, default)
+
+    def append(self, node):
+        self._children.append(node)
+
+    def remove(self, node):
+        self._children.remove(node)
+
+    def find(self, tag):
+        for child in self._children:
+            if child.tag == tag:
+                return child
+
+    def findall(self, tag):
+        return [child for child in self._children if child.tag == tag]
+
+    def iter(self, tag=None):
+        if tag is None or self.tag == tag:
+            yield self
+        for child in self._children:
+            for node in child.iter(tag):
+                yield node
+
+
+class ExpatParser(object):
+    """ Minimal parser backend driving expat directly. Builds :class:`~plexapi.parser.Node`
+        objects holding only the tag, attributes and children of each element, skipping
+        text, tails and the rest of the ElementTree machinery.
+    """
+    name = 'expat'
+    ParseError = expat.ExpatError
+    chunksize = 65536
+
+    def _parser(self, events):
+        stack = []
+
+        def start(tag, attrib):
+            node = Node(tag, attrib)
+            if stack:
+                stack[-1].append(node)
+            stack.append(node)
+            events.append(('start', node))
+
+        def end(tag):
+            events.append(('end', stack.pop()))
+
+        parser = expat.ParserCreate()
+        parser.buffer_text = True
+        parser.StartElementHandler = start
+        parser.EndElementHandler = end
+        return parser
+
+    def fromstring(self, data):
+        events = []
+        self._parser(events).Parse(data, True)
+        return events[0][1]
+
+    def iterparse(self, source):
+        events = []
+        parser = self._parser(events)
+        while True:
+            chunk = source.read(self.chunksize)
+            parser.Parse(chunk, not chunk)
+            for event in events:
+                yield event
+            del events[:]
+            if not chunk:
+                break
+
+
+class JsonNode(Node):
+    """ Adapter exposing an object from a JSON response (``Accept: application/json``) with the
+        same interface as :class:`~plexapi.parser.Node`, so the object model reads JSON and XML
+        responses alike. Scalar values become the attrib dict, converted to strings as they
+        appear in XML (booleans as '1' or '0'). Lists of objects become children tagged with
+        their key, except items listed under Metadata which are tagged as the XML element
+        (Video, Directory, Track, ..) matching their type. The attrib dict and children are
+        only built when first accessed.
+    """
+    __slots__ = ('_json',)
+
+    def __init__(self, tag, json):
+        self.tag = tag
+        self._json = json
+
+    def __repr__(self):
+        return '<JsonNode %s at 0x%x>' % (self.tag, id(self))
+
+    def __getattr__(self, attr):
+        # only called while the attrib and _children slots are still unset
+        if attr not in ('attrib', '_children'):
+            raise AttributeError(attr)
+        attrib, children = {}, []
+        for key, value in self._json.items():
+            if isinstance(value, list):
+                children.extend(JsonNode(_jsonTag(key, item), item) for item in value if isinstance(item, dict))
+            elif isinstance(value, dict):
+                children.append(JsonNode(key, value))
+            elif isinstance(value, bool):
+                attrib[key] = '1' if value else '0'
+            elif isinstance(value, compat.string_type):
+                attrib[key] = value
+            elif value is not None:
+                attrib[key] = str(value)
+        self.attrib, self._children = attrib, children
+        return getattr(self, attr)
+
+
+# XML element tag of the items listed under Metadata in JSON responses, by type
+JSONTAGS = {'movie': 'Video', 'episode': 'Video', 'clip': 'Video', 'trailer': 'Video',
+    'track': 'Track', 'photo': 'Photo', 'playlist': 'Playlist'}
+
+
+def _jsonTag(key, item):
+    if key != 'Metadata':
+        return key
+    tag = JSONTAGS.get(item.get('type'), 'Directory')
+    # photo albums share the type of the photos in them
+    return 'Directory' if tag == 'Photo' and 'Media' not in item else tag
+
+
+def parseJson(data):
+    """ Returns the root :class:`~plexapi.parser.JsonNode` (MediaContainer) parsed from the
+        specified JSON response body or None if the body is empty.
+
+        Parameters:
+            data (bytes): Raw response body.
+    """
+    if not data or data.isspace():
+        return None
+    data = json.loads(data.decode('utf8'))
+    tag = next(iter(data)) if len(data) == 1 else 'MediaContainer'
+    return JsonNode(tag, data[tag] if len(data) == 1 else data)
+
+
+PARSERS = {'etree': ElementTreeParser, 'lxml': LxmlParser, 'expat': ExpatParser}
+
+
+def getParser():
+    """ Returns the XML parser backend used to parse all responses. The backend is selected
+        by the config ``plexapi.xml_parser`` (one of etree, lxml or expat). By default the
+        standard library ElementTree is used.
+    """
+    if _PARSER is None:
+        setParser()
+    return _PARSER
+
+
+def setParser(name=None):
+    """ Select the XML parser backend by name (lxml, etree or expat), or the configured default
+        if not specified. Returns the parser instance.
+    """
+    global _PARSER
+    if name is None:
+        from plexapi import CONFIG
+        name = CONFIG.get('plexapi.xml_parser', 'etree')
+    if name.lower() not in PARSERS:
+        raise Unsupported('Unknown XML parser %s, expected one of: %s' % (name, ', '.join(sorted(PARSERS))))
+    _PARSER = PARSERS[name.lower()]()
+    return _PARSER
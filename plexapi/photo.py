@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
-from plexapi import media, utils
-from plexapi.base import PlexPartialObject
+from plexapi import utils
+import plexapi.media  # noqa: F401 (registers the Media, MediaPart and tag objects)
+from plexapi.base import Items, PlexPartialObject
 from plexapi.exceptions import NotFound
 
 
@@ -103,6 +104,7 @@ class Photo(PlexPartialObject):
     """
     TAG = 'Photo'
     TYPE = 'photo'
+    media = Items('Media')
 
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
@@ -121,7 +123,6 @@ class Photo(PlexPartialObject):
         self.type = data.attrib.get('type')
         self.updatedAt = utils.toDatetime(data.attrib.get('updatedAt'))
         self.year = utils.cast(int, data.attrib.get('year'))
-        self.media = self.findItems(data, media.Media)
 
     def photoalbum(self):
         """ Return this photo's :class:`~plexapi.photo.Photoalbum`. """
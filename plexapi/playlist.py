@@ -16,6 +16,7 @@ class Playlist(PlexPartialObject, Playable):
 
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
+        self._data = data
         Playable._loadData(self, data)
         self.addedAt = toDatetime(data.attrib.get('addedAt'))
         self.composite = data.attrib.get('composite')  # url to thumbnail
@@ -43,8 +44,13 @@ class Playlist(PlexPartialObject, Playable):
     def __getitem__(self, key):
         return self.items()[key]
 
-    def items(self):
-        """ Returns a list of all items in the playlist. """
+    def items(self, **kwargs):
+        """ Returns a list of all items in the playlist. kwargs are passed to
+            :func:`~plexapi.base.PlexObject.fetchItems` (container_size, maxresults, ..);
+            only the list of all items is cached.
+        """
+        if kwargs:
+            return self.fetchItems('%s/items' % self.key, **kwargs)
         if self._items is None:
             key = '%s/items' % self.key
             items = self.fetchItems(key)
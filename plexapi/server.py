@@ -1,23 +1,24 @@
 # -*- coding: utf-8 -*-
-import requests
+import weakref
+from contextlib import closing
 from requests.status_codes import _codes as codes
-from plexapi import BASE_HEADERS, CONFIG, TIMEOUT
+import plexapi
+from plexapi import CONFIG, TIMEOUT
 from plexapi import log, logfilter, utils
 from plexapi.alert import AlertListener
-from plexapi.base import PlexObject
+from plexapi.base import PlexObject, PlexPartialObject
 from plexapi.client import PlexClient
-from plexapi.compat import ElementTree, urlencode
-from plexapi.exceptions import BadRequest, NotFound
+from plexapi.compat import urlencode
+from plexapi.exceptions import BadRequest, NotFound, Unsupported
+from plexapi.executor import getExecutor
 from plexapi.library import Library, Hub
+from plexapi.paging import ContainerSizer
+from plexapi.parser import Node, getParser, parseJson
 from plexapi.settings import Settings
 from plexapi.playlist import Playlist
 from plexapi.playqueue import PlayQueue
 from plexapi.utils import cast
 
-# Need these imports to populate utils.PLEXOBJECTS
-from plexapi import (audio as _audio, video as _video,        # noqa: F401
-    photo as _photo, media as _media, playlist as _playlist)  # noqa: F401
-
 
 class PlexServer(PlexObject):
     """ This is the main entry point to interacting with a Plex server. It allows you to
@@ -32,6 +33,25 @@ class PlexServer(PlexObject):
             session (requests.Session, optional): Use your own session object if you want to
                 cache the http responses from PMS
             timeout (int): timeout in seconds on initial connect to server (default config.TIMEOUT).
+            cache (:class:`~plexapi.cache.ResponseCache`, optional): Cache GET responses and revalidate
+                them with conditional requests. See :class:`~plexapi.cache.MemoryCache` and
+                :class:`~plexapi.cache.DiskCache`.
+            format (str): Response format requested from the server, xml or json (default: xml).
+                JSON responses are cheaper to decode for large reads; they are exposed to the
+                object model through :class:`~plexapi.parser.JsonNode`.
+            lazy (bool): Set True to not connect to the server until a root attribute (friendlyName,
+                version, ..) is read. Requests made before that do not fetch the root attributes.
+            snapshot (:class:`~plexapi.cache.ServerSnapshot`, optional): With lazy, load the root
+                attributes from this snapshot without any request when available, and revalidate
+                (and update) them in the background.
+            keep_xml (bool): Set False to drop the XML each item was built from once built, so
+                long-lived items do not keep whole responses in memory. Items are then fully
+                decoded when built, and reloading an item fetches its XML again. Can also be set
+                per call, see :func:`~plexapi.base.PlexObject.fetchItem`.
+            identity_map (bool or :class:`~plexapi.cache.IdentityMap`): Set True to return the same
+                object each time a library item is built again while it is still referenced, rather
+                than a new copy (see :class:`~plexapi.cache.IdentityMap`). An IdentityMap instance
+                may be passed to share it with other servers.
 
         Attributes:
             allowCameraUpload (bool): True if server allows camera upload.
@@ -90,16 +110,76 @@ class PlexServer(PlexObject):
             _session (obj): Requests session object used to access this client.
     """
     key = '/'
-
-    def __init__(self, baseurl=None, token=None, session=None, timeout=None):
+    # Root attributes set by _loadData(), read from / on first access by a lazy server
+    _ROOTATTRS = frozenset(('allowCameraUpload', 'allowChannelAccess', 'allowMediaDeletion', 'allowSharing',
+        'allowSync', 'backgroundProcessing', 'certificate', 'companionProxy', 'diagnostics', 'eventStream',
+        'friendlyName', 'hubSearch', 'machineIdentifier', 'multiuser', 'myPlex', 'myPlexMappingState',
+        'myPlexSigninState', 'myPlexSubscription', 'myPlexUsername', 'ownerFeatures', 'photoAutoTag', 'platform',
+        'platformVersion', 'pluginHost', 'readOnlyLibraries', 'requestParametersInCookie', 'streamingBrainVersion',
+        'sync', 'transcoderActiveVideoSessions', 'transcoderAudio', 'transcoderLyrics', 'transcoderPhoto',
+        'transcoderSubtitles', 'transcoderVideo', 'transcoderVideoBitrates', 'transcoderVideoQualities',
+        'transcoderVideoResolutions', 'updatedAt', 'updater', 'version', 'voiceSearch'))
+
+    def __init__(self, baseurl=None, token=None, session=None, timeout=None, cache=None, format='xml',
+            lazy=False, snapshot=None, keep_xml=True, identity_map=False):
+        if format not in ('xml', 'json'):
+            raise Unsupported('Unknown response format %s, expected xml or json' % format)
         self._baseurl = baseurl or CONFIG.get('auth.server_baseurl', 'http://localhost:32400')
         self._token = logfilter.add_secret(token or CONFIG.get('auth.server_token'))
-        self._session = session or requests.Session()
+        self._session = session or utils.getSession()
+        self._cache = cache
+        self._format = format
+        self._keepXml = keep_xml
+        self._identityMap = identity_map or None
+        if identity_map is True:
+            from plexapi.cache import IdentityMap
+            self._identityMap = IdentityMap()
+        self._inflight = utils.SingleFlight()   # coalesces concurrent GETs
+        self._tags = weakref.WeakValueDictionary()   # shared media tags, see MediaTag._internKey
+        self._containerSizer = ContainerSizer()   # page size of paged fetches
         self._library = None   # cached library
         self._settings = None   # cached settings
         self._myPlexAccount = None   # cached myPlexAccount
-        data = self.query(self.key, timeout=timeout)
-        super(PlexServer, self).__init__(self, data, self.key)
+        self._snapshot = snapshot
+        self._timeout = timeout
+        if not lazy:
+            data = self.query(self.key, timeout=timeout)
+            super(PlexServer, self).__init__(self, data, self.key)
+            return
+        super(PlexServer, self).__init__(self, None, self.key)
+        attrib = snapshot.get(self._baseurl) if snapshot else None
+        if attrib is not None:
+            self._loadData(Node('MediaContainer', attrib))
+            getExecutor().submit(self._revalidateRoot)
+
+    def __getattr__(self, attr):
+        # Only called for attributes not set; load the root attributes of a lazy server
+        if attr not in self._ROOTATTRS or self.__dict__.get('_data') is not None:
+            raise AttributeError("'%s' object has no attribute '%s'" % (self.__class__.__name__, attr))
+        self._loadRoot()
+        return super(PlexServer, self).__getattribute__(attr)
+
+    def _loadRoot(self):
+        """ Fetch and load the root attributes (and update the snapshot if there is one). """
+        data = self.query(self.key, timeout=self._timeout)
+        if data is None:
+            raise BadRequest('No root attributes returned by %s' % self._baseurl)
+        previous = self.__dict__.get('machineIdentifier')
+        self._loadData(data)
+        if previous and previous != self.machineIdentifier:
+            # A different server answers on baseurl, forget what was cached from the previous one
+            log.warning('Server at %s changed from %s to %s', self._baseurl, previous, self.machineIdentifier)
+            self._library = None
+            self._settings = None
+            self._myPlexAccount = None
+        if self._snapshot is not None:
+            self._snapshot.set(self._baseurl, dict(data.attrib))
+
+    def _revalidateRoot(self):
+        try:
+            self._loadRoot()
+        except Exception as err:
+            log.warning('Unable to revalidate root attributes of %s: %s', self._baseurl, err)
 
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
@@ -148,7 +228,7 @@ class PlexServer(PlexObject):
 
     def _headers(self, **kwargs):
         """ Returns dict containing base headers for all requests to the server. """
-        headers = BASE_HEADERS.copy()
+        headers = plexapi.BASE_HEADERS.copy()
         if self._token:
             headers['X-Plex-Token'] = self._token
         headers.update(kwargs)
@@ -168,6 +248,14 @@ class PlexServer(PlexObject):
                 return Library(self, data)
         return self._library
 
+    @property
+    def containerSizer(self):
+        """ :class:`~plexapi.paging.ContainerSizer` choosing the page size of the paged fetches
+            of this server. Its size is the page size requested next and its stats the
+            measurements of the last pages read.
+        """
+        return self._containerSizer
+
     @property
     def settings(self):
         """ Returns a list of all server settings. """
@@ -306,15 +394,56 @@ class PlexServer(PlexObject):
             # figure out what method this is..
             return self.query(part, method=self._session.put)
 
-    def history(self):
-        """ Returns a list of media items from watched history. """
-        return self.fetchItems('/status/sessions/history/all')
+    def history(self, maxresults=999999, **kwargs):
+        """ Returns a list of media items from watched history. The history is read in pages
+            sized by :attr:`~plexapi.server.PlexServer.containerSizer`, see
+            :func:`~plexapi.base.PlexObject.fetchItems`.
+
+            Parameters:
+                maxresults (int): Only return the specified number of entries (optional).
+                **kwargs (dict): Passed to :func:`~plexapi.base.PlexObject.fetchItems`
+                    (container_size, attribute filters, ..).
+        """
+        return self.fetchItems('/status/sessions/history/all', maxresults=maxresults, **kwargs)
+
+    def hydrate(self, items, maxlength=2000):
+        """ Reloads the partial objects in items (see :class:`~plexapi.base.PlexPartialObject`) in
+            place, requesting many of them at once from /library/metadata/<id1>,<id2>,.. instead
+            of one request per object. Requests are split so their path is at most maxlength
+            characters and run concurrently. Returns items.
 
-    def playlists(self):
-        """ Returns a list of all :class:`~plexapi.playlist.Playlist` objects saved on the server. """
+            Parameters:
+                items (list): Items to reload (full objects and objects without a ratingKey are skipped).
+                maxlength (int): Max length of the path of each request (default 2000).
+        """
+        partial = {}
+        for item in items:
+            if isinstance(item, PlexPartialObject) and item.isPartialObject():
+                ratingKey = item.firstAttr('ratingKey')  # without reloading the item
+                if ratingKey is not None:
+                    partial.setdefault(str(ratingKey), []).append(item)
+        keys, ids = [], []
+        for ratingKey in partial:
+            if ids and len('/library/metadata/%s,%s' % (','.join(ids), ratingKey)) > maxlength:
+                keys.append('/library/metadata/%s' % ','.join(ids))
+                ids = []
+            ids.append(ratingKey)
+        if ids:
+            keys.append('/library/metadata/%s' % ','.join(ids))
+        for data in getExecutor().map(self.query, [[key] for key in keys]):
+            for elem in data if data is not None else []:
+                for item in partial.get(elem.attrib.get('ratingKey'), []):
+                    item._reloadFrom(item.key, elem)
+        return items
+
+    def playlists(self, **kwargs):
+        """ Returns a list of all :class:`~plexapi.playlist.Playlist` objects saved on the server.
+            kwargs are passed to :func:`~plexapi.base.PlexObject.fetchItems` (container_size,
+            maxresults, attribute filters, ..).
+        """
         # TODO: Add sort and type options?
         # /playlists/all?type=15&sort=titleSort%3Aasc&playlistType=video&smart=0
-        return self.fetchItems('/playlists')
+        return self.fetchItems('/playlists', **kwargs)
 
     def playlist(self, title):
         """ Returns the :class:`~plexapi.client.Playlist` that matches the specified title.
@@ -329,22 +458,112 @@ class PlexServer(PlexObject):
 
     def query(self, key, method=None, headers=None, timeout=None, **kwargs):
         """ Main method used to handle HTTPS requests to the Plex server. This method helps
-            by encoding the response to utf-8 and parsing the returned XML into and
-            ElementTree object. Returns None if no data exists in the response.
+            by parsing the raw bytes of the returned XML into an ElementTree object. Returns
+            None if no data exists in the response. Concurrent GET requests for the same key
+            are coalesced into a single request sharing the parsed result.
+        """
+        if method is None or method.__name__ == 'get':
+            if kwargs:
+                return self._get(key, method, headers, timeout, **kwargs)
+            # concurrent requests for the same url wait for the one in flight and share its result
+            flight = (self.url(key), tuple(sorted((headers or {}).items())))
+            return self._inflight.do(flight, self._get, key, method, headers, timeout)
+        response = self._request(key, method, headers, timeout, **kwargs)
+        return self._parse(response.content)
+
+    def _get(self, key, method=None, headers=None, timeout=None, **kwargs):
+        """ GET the specified key, through the response cache if one is set. """
+        if self._cache is not None:
+            return self._cachedQuery(key, method, headers, timeout, **kwargs)
+        response = self._request(key, method, headers, timeout, **kwargs)
+        return self._parse(response.content)
+
+    def _queryPage(self, key):
+        """ GET the specified page of a paged fetch, returns the parsed data and the size of the
+            response body in bytes (None when read through the response cache, which may answer
+            without a body). See :func:`~plexapi.base.PlexObject._fetchPage`.
+        """
+        if self._cache is not None:
+            return self.query(key), None
+        response = self._request(key)
+        return self._parse(response.content), len(response.content)
+
+    def _parse(self, content):
+        """ Returns the root element of the specified response body in the format of this server. """
+        if self._format == 'json':
+            return parseJson(content)
+        return utils.parseXml(content)
+
+    def _cachedQuery(self, key, method=None, headers=None, timeout=None, **kwargs):
+        """ GET the specified key sending the validators of the cached response (if any). On
+            304 Not Modified the cached data is returned, otherwise the new response is parsed
+            and stored in the cache.
+        """
+        url = self.url(key)
+        cached = self._cache.get(url, self._format)
+        headers = dict(headers or {})
+        if cached is not None:
+            headers.update(cached[0])
+        response = self._request(key, method, headers, timeout, **kwargs)
+        if response.status_code == 304 and cached is not None:
+            self._cache.hit()
+            return cached[1]
+        self._cache.miss()
+        data = self._parse(response.content)
+        self._cache.set(url, response, data, self._format)
+        return data
+
+    def iterQuery(self, key, headers=None, timeout=None, **kwargs):
+        """ Streaming version of :func:`~plexapi.server.PlexServer.query()`. Rather than reading
+            the full response into memory, the body is parsed incrementally as it arrives and
+            each top-level child of the returned container is yielded as soon as its closing
+            tag is read. Yielded elements are detached from the container afterwards, so memory
+            stays flat regardless of the container size. Only GET requests are supported.
+            JSON responses can not be parsed incrementally; the full response is read first.
+        """
+        if self._format == 'json':
+            for elem in self.query(key, headers=headers, timeout=timeout, **kwargs) or []:
+                yield elem
+            return
+        response = self._request(key, headers=headers, timeout=timeout, stream=True, **kwargs)
+        response.raw.decode_content = True
+        with closing(response):
+            parser, root, depth = getParser(), None, 0
+            try:
+                for event, elem in parser.iterparse(response.raw):
+                    if event == 'start':
+                        root = elem if root is None else root
+                        depth += 1
+                        continue
+                    depth -= 1
+                    if depth == 1:
+                        yield elem
+                        root.remove(elem)
+            except parser.ParseError:
+                # an empty response body is not an error (same as query returning None)
+                if root is not None:
+                    raise
+
+    def _request(self, key, method=None, headers=None, timeout=None, **kwargs):
+        """ Sends the request to the Plex server and returns the response object. Raises
+            :class:`~plexapi.exceptions.BadRequest` if the server does not respond with success
+            (or 304 Not Modified to a conditional request, see :func:`_cachedQuery`).
         """
         url = self.url(key)
         method = method or self._session.get
         timeout = timeout or TIMEOUT
         log.debug('%s %s', method.__name__.upper(), url)
         headers = self._headers(**headers or {})
+        if self._format == 'json':
+            headers.setdefault('Accept', 'application/json')
         response = method(url, headers=headers, timeout=timeout, **kwargs)
-        if response.status_code not in (200, 201):
+        conditional = 'If-None-Match' in headers or 'If-Modified-Since' in headers
+        if response.status_code not in ((200, 201, 304) if conditional else (200, 201)):
             codename = codes.get(response.status_code)[0]
             errtext = response.text.replace('\n', ' ')
             log.warning('BadRequest (%s) %s %s; %s' % (response.status_code, codename, response.url, errtext))
             raise BadRequest('(%s) %s; %s %s' % (response.status_code, codename, response.url, errtext))
-        data = response.text.encode('utf8')
-        return ElementTree.fromstring(data) if data.strip() else None
+        return response
 
     def search(self, query, mediatype=None, limit=None):
         """ Returns a list of media items or filter categories from the resulting
@@ -374,9 +593,11 @@ class PlexServer(PlexObject):
             results += hub.items
         return results
 
-    def sessions(self):
-        """ Returns a list of all active session (currently playing) media objects. """
-        return self.fetchItems('/status/sessions')
+    def sessions(self, **kwargs):
+        """ Returns a list of all active session (currently playing) media objects. kwargs are
+            passed to :func:`~plexapi.base.PlexObject.fetchItems` (container_size, maxresults, ..).
+        """
+        return self.fetchItems('/status/sessions', **kwargs)
 
     def startAlertListener(self, callback=None):
         """ Creates a websocket connection to the Plex Server to optionally recieve
@@ -19,10 +19,10 @@ class SyncItem(object):
         self.title = data.attrib.get('title')
         self.metadataType = data.attrib.get('metadataType')
         self.machineIdentifier = data.find('Server').get('machineIdentifier')
-        self.status = data.find('Status').attrib.copy()
-        self.MediaSettings = data.find('MediaSettings').attrib.copy()
-        self.policy = data.find('Policy').attrib.copy()
-        self.location = data.find('Location').attrib.copy()
+        self.status = dict(data.find('Status').attrib)
+        self.MediaSettings = dict(data.find('MediaSettings').attrib)
+        self.policy = dict(data.find('Policy').attrib)
+        self.location = dict(data.find('Location').attrib)
 
     def server(self):
         server = list(filter(lambda x: x.machineIdentifier == self.machineIdentifier, self._servers))
@@ -7,16 +7,25 @@ import time
 import zipfile
 from datetime import datetime
 from getpass import getpass
-from threading import Thread
-from tqdm import tqdm
+from importlib import import_module
+from threading import Event, Lock
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
 from plexapi import compat
 from plexapi.exceptions import NotFound
+from plexapi.parser import getParser
 
 # Search Types - Plex uses these to filter specific media types when searching.
 # Library Types - Populated at runtime
 SEARCHTYPES = {'movie': 1, 'show': 2, 'season': 3, 'episode': 4,
                'artist': 8, 'album': 9, 'track': 10, 'photo': 14}
 PLEXOBJECTS = {}
+# Modules populating PLEXOBJECTS - Imported on first lookup, see getPlexObject()
+PLEXOBJECT_MODULES = ('audio', 'library', 'media', 'photo', 'playlist', 'video')
+_PLEXOBJECTS_LOADED = False
+# Process-wide requests session - See getSession()
+_SESSION = None
+_SESSION_LOCK = Lock()
 
 
 class SecretsFilter(logging.Filter):
@@ -40,6 +49,46 @@ class SecretsFilter(logging.Filter):
         return True
 
 
+class SingleFlight(object):
+    """ Coalesces concurrent calls sharing the same key. The first caller runs the function
+        while callers arriving before it returns wait for it and share its result (or
+        exception) instead of running the function again. Used by
+        :func:`~plexapi.server.PlexServer.query()` so concurrent GETs of the same url
+        result in a single request.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._calls = {}
+
+    def do(self, key, func, *args, **kwargs):
+        r""" Returns the result of func(\*args, \*\*kwargs), sharing the call with any
+            concurrent call for the same key.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = {'event': Event()}
+                leader = True
+            else:
+                leader = False
+        if not leader:
+            call['event'].wait()
+            if 'error' in call:
+                raise call['error']
+            return call['result']
+        try:
+            call['result'] = func(*args, **kwargs)
+            return call['result']
+        except Exception as err:
+            call['error'] = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call['event'].set()
+
+
 def registerPlexObject(cls):
     """ Registry of library types we may come across when parsing XML. This allows us to
         define a few helper functions to dynamically convery the XML into objects. See
@@ -54,6 +103,34 @@ def registerPlexObject(cls):
     return cls
 
 
+def getPlexObject(ehash, tag=None):
+    """ Returns the class registered for the specified ehash ('<tag>.<type>'), falling back
+        to the class registered for tag, or None. The modules defining the library types
+        (PLEXOBJECT_MODULES) are imported on the first lookup rather than at import time, so
+        scripts that never build library items don't pay for importing them.
+    """
+    global _PLEXOBJECTS_LOADED
+    if not _PLEXOBJECTS_LOADED:
+        for module in PLEXOBJECT_MODULES:
+            import_module('plexapi.%s' % module)
+        _PLEXOBJECTS_LOADED = True
+    return PLEXOBJECTS.get(ehash, PLEXOBJECTS.get(tag))
+
+
+def parseXml(data):
+    """ Returns the root element parsed from the specified response body or None if the
+        body is empty. Bytes (requests ``response.content``) are passed to the parser as-is,
+        leaving charset handling to the XML declaration rather than decoding and re-encoding
+        the full body first. See :func:`~plexapi.parser.getParser()` for the parser used.
+
+        Parameters:
+            data (bytes): Raw response body.
+    """
+    if not data or data.isspace():
+        return None
+    return getParser().fromstring(data)
+
+
 def cast(func, value):
     """ Cast the specified value to the specified type (returned by func). Currently this
         only support int, float, bool. Should be extended if needed.
@@ -74,6 +151,47 @@ def cast(func, value):
     return value
 
 
+def internStr(value):
+    """ Returns the interned copy of the specified string (see :func:`sys.intern`), so the
+        values repeated across many items (codecs, containers, languages, ..) share a single
+        string object. Values other than native strings are returned unchanged.
+
+        Parameters:
+            value (str): String to intern or None.
+    """
+    return compat.intern(value) if type(value) is str else value
+
+
+def getSession():
+    """ Returns the process-wide requests.Session shared by PlexServer, PlexClient, MyPlexAccount
+        and downloads when no session is passed to them. Sharing the session means requests
+        to the same host reuse pooled keep-alive connections instead of paying a new TCP/TLS
+        handshake each time. The connection pool sizes and retry policy are read from the
+        config options plexapi.pool_connections, plexapi.pool_maxsize, plexapi.max_retries
+        and plexapi.retry_backoff. Only idempotent requests are retried, on connection errors
+        and 502/503 responses.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            from plexapi import CONFIG
+            retries = CONFIG.get('plexapi.max_retries', 3, int)
+            kwargs = dict(total=retries, connect=retries, read=0, status=retries, raise_on_status=False,
+                backoff_factor=CONFIG.get('plexapi.retry_backoff', 0.5, float), status_forcelist=(502, 503))
+            try:
+                retry = Retry(allowed_methods=Retry.DEFAULT_ALLOWED_METHODS, **kwargs)
+            except (AttributeError, TypeError):  # urllib3 < 1.26
+                retry = Retry(method_whitelist=Retry.DEFAULT_METHOD_WHITELIST, **kwargs)
+            adapter = HTTPAdapter(max_retries=retry,
+                pool_connections=CONFIG.get('plexapi.pool_connections', 10, int),
+                pool_maxsize=CONFIG.get('plexapi.pool_maxsize', 32, int))
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _SESSION = session
+        return _SESSION
+
+
 def getattributeOrNone(obj, self, attr):
     """ Returns result from __getattribute__ or None if not found. """
     try:
@@ -150,23 +268,21 @@ def searchType(libtype):
     raise NotFound('Unknown libtype: %s' % libtype)
 
 
-def threaded(callback, listargs):
+def threaded(callback, listargs, timeout=None):
     """ Returns the result of <callback> for each set of \*args in listargs. Each call
-        to <callback. is called concurrently in their own separate threads.
+        to <callback> is run concurrently on the library-wide bounded executor (see
+        :func:`~plexapi.executor.getExecutor()`), so the number of threads stays bounded
+        however long listargs is. Exceptions raised by <callback> are propagated.
 
         Parameters:
             callback (func): Callback function to apply to each set of \*args.
             listargs (list): List of lists; \*args to pass each thread.
+            timeout (int): Max seconds to wait for each call (default None; wait forever).
     """
-    threads, results = [], []
-    for args in listargs:
-        args += [results, len(results)]
-        results.append(None)
-        threads.append(Thread(target=callback, args=args))
-        threads[-1].setDaemon(True)
-        threads[-1].start()
-    for thread in threads:
-        thread.join()
+    from plexapi.executor import getExecutor
+    results = [None] * len(listargs)
+    listargs = [list(args) + [results, i] for i, args in enumerate(listargs)]
+    getExecutor().map(callback, listargs, timeout)
     return results
 
 
@@ -251,7 +367,7 @@ def download(url, filename=None, savepath=None, session=None, chunksize=4024,
 
     from plexapi import log
     # fetch the data to be saved
-    session = session or requests.Session()
+    session = session or getSession()
     response = session.get(url, stream=True)
     # make sure the savepath directory exists
     savepath = savepath or os.getcwd()
@@ -279,6 +395,7 @@ def download(url, filename=None, savepath=None, session=None, chunksize=4024,
     # save the file to disk
     log.info('Downloading: %s', fullpath)
     if showstatus:
+        from tqdm import tqdm
         total = int(response.headers.get('content-length', 0))
         bar = tqdm(unit='B', unit_scale=True, total=total, desc=filename)
 
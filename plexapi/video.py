@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
-from plexapi import media, utils
+from plexapi import utils
+import plexapi.media  # noqa: F401 (registers the Media, MediaPart and tag objects)
 from plexapi.exceptions import BadRequest, NotFound
-from plexapi.base import Playable, PlexPartialObject
+from plexapi.base import Attr, Items, Playable, PlexPartialObject
 
 
 class Video(PlexPartialObject):
@@ -24,23 +25,23 @@ class Video(PlexPartialObject):
             updatedAt (datatime): Datetime this item was updated.
             viewCount (int): Count of times this item was accessed.
     """
+    listType = 'video'
+    addedAt = Attr(utils.toDatetime)
+    lastViewedAt = Attr(utils.toDatetime)
+    librarySectionID = Attr()
+    ratingKey = Attr(int)
+    summary = Attr()
+    thumb = Attr()
+    title = Attr()
+    type = Attr()
+    updatedAt = Attr(utils.toDatetime)
+    viewCount = Attr(int, default=0)
 
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
         self._data = data
-        self.listType = 'video'
-        self.addedAt = utils.toDatetime(data.attrib.get('addedAt'))
         self.key = data.attrib.get('key')
-        self.lastViewedAt = utils.toDatetime(data.attrib.get('lastViewedAt'))
-        self.librarySectionID = data.attrib.get('librarySectionID')
-        self.ratingKey = utils.cast(int, data.attrib.get('ratingKey'))
-        self.summary = data.attrib.get('summary')
-        self.thumb = data.attrib.get('thumb')
-        self.title = data.attrib.get('title')
-        self.titleSort = data.attrib.get('titleSort', self.title)
-        self.type = data.attrib.get('type')
-        self.updatedAt = utils.toDatetime(data.attrib.get('updatedAt'))
-        self.viewCount = utils.cast(int, data.attrib.get('viewCount', 0))
+        self.titleSort = data.attrib.get('titleSort', data.attrib.get('title'))
 
     @property
     def isWatched(self):
@@ -102,39 +103,38 @@ class Movie(Video, Playable):
     """
     TAG = 'Video'
     TYPE = 'movie'
+    art = Attr()
+    audienceRating = Attr(float)
+    audienceRatingImage = Attr()
+    chapterSource = Attr()
+    contentRating = Attr(utils.internStr)
+    duration = Attr(int)
+    guid = Attr()
+    originalTitle = Attr()
+    originallyAvailableAt = Attr(lambda value: utils.toDatetime(value, '%Y-%m-%d'))
+    primaryExtraKey = Attr()
+    rating = Attr(float)
+    ratingImage = Attr()
+    studio = Attr(utils.internStr)
+    tagline = Attr()
+    userRating = Attr(float)
+    viewOffset = Attr(int, default=0)
+    year = Attr(int)
+    collections = Items('Collection')
+    countries = Items('Country')
+    directors = Items('Director')
+    fields = Items('Field')
+    genres = Items('Genre')
+    media = Items('Media')
+    producers = Items('Producer')
+    roles = Items('Role')
+    writers = Items('Writer')
+    labels = Items('Label')
 
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
         Video._loadData(self, data)
         Playable._loadData(self, data)
-        self.art = data.attrib.get('art')
-        self.audienceRating = utils.cast(float, data.attrib.get('audienceRating'))
-        self.audienceRatingImage = data.attrib.get('audienceRatingImage')
-        self.chapterSource = data.attrib.get('chapterSource')
-        self.contentRating = data.attrib.get('contentRating')
-        self.duration = utils.cast(int, data.attrib.get('duration'))
-        self.guid = data.attrib.get('guid')
-        self.originalTitle = data.attrib.get('originalTitle')
-        self.originallyAvailableAt = utils.toDatetime(
-            data.attrib.get('originallyAvailableAt'), '%Y-%m-%d')
-        self.primaryExtraKey = data.attrib.get('primaryExtraKey')
-        self.rating = utils.cast(float, data.attrib.get('rating'))
-        self.ratingImage = data.attrib.get('ratingImage')
-        self.studio = data.attrib.get('studio')
-        self.tagline = data.attrib.get('tagline')
-        self.userRating = utils.cast(float, data.attrib.get('userRating'))
-        self.viewOffset = utils.cast(int, data.attrib.get('viewOffset', 0))
-        self.year = utils.cast(int, data.attrib.get('year'))
-        self.collections = self.findItems(data, media.Collection)
-        self.countries = self.findItems(data, media.Country)
-        self.directors = self.findItems(data, media.Director)
-        self.fields = self.findItems(data, media.Field)
-        self.genres = self.findItems(data, media.Genre)
-        self.media = self.findItems(data, media.Media)
-        self.producers = self.findItems(data, media.Producer)
-        self.roles = self.findItems(data, media.Role)
-        self.writers = self.findItems(data, media.Writer)
-        self.labels = self.findItems(data, media.Label)
 
     @property
     def actors(self):
@@ -214,6 +214,10 @@ class Show(Video):
     """
     TAG = 'Directory'
     TYPE = 'show'
+    genres = Items('Genre')
+    labels = Items('Label')
+    locations = Items('Location', 'path')
+    roles = Items('Role')
 
     def __iter__(self):
         for season in self.seasons():
@@ -227,22 +231,18 @@ class Show(Video):
         self.art = data.attrib.get('art')
         self.banner = data.attrib.get('banner')
         self.childCount = utils.cast(int, data.attrib.get('childCount'))
-        self.contentRating = data.attrib.get('contentRating')
+        self.contentRating = utils.internStr(data.attrib.get('contentRating'))
         self.duration = utils.cast(int, data.attrib.get('duration'))
         self.guid = data.attrib.get('guid')
         self.index = data.attrib.get('index')
         self.leafCount = utils.cast(int, data.attrib.get('leafCount'))
-        self.locations = self.listAttrs(data, 'path', etag='Location')
         self.originallyAvailableAt = utils.toDatetime(
             data.attrib.get('originallyAvailableAt'), '%Y-%m-%d')
         self.rating = utils.cast(float, data.attrib.get('rating'))
-        self.studio = data.attrib.get('studio')
+        self.studio = utils.internStr(data.attrib.get('studio'))
         self.theme = data.attrib.get('theme')
         self.viewedLeafCount = utils.cast(int, data.attrib.get('viewedLeafCount'))
         self.year = utils.cast(int, data.attrib.get('year'))
-        self.genres = self.findItems(data, media.Genre)
-        self.roles = self.findItems(data, media.Role)
-        self.labels = self.findItems(data, media.Label)
 
     @property
     def actors(self):
@@ -459,39 +459,38 @@ class Episode(Video, Playable):
     """
     TAG = 'Video'
     TYPE = 'episode'
+    art = Attr()
+    chapterSource = Attr()
+    contentRating = Attr(utils.internStr)
+    duration = Attr(int)
+    grandparentArt = Attr()
+    grandparentKey = Attr()
+    grandparentRatingKey = Attr(int)
+    grandparentTheme = Attr()
+    grandparentThumb = Attr()
+    grandparentTitle = Attr()
+    guid = Attr()
+    index = Attr(int)
+    originallyAvailableAt = Attr(lambda value: utils.toDatetime(value, '%Y-%m-%d'))
+    parentIndex = Attr()
+    parentKey = Attr()
+    parentRatingKey = Attr(int)
+    parentThumb = Attr()
+    parentTitle = Attr()
+    rating = Attr(float)
+    viewOffset = Attr(int, default=0)
+    year = Attr(int)
+    directors = Items('Director')
+    media = Items('Media')
+    writers = Items('Writer')
+    labels = Items('Label')
+    collections = Items('Collection')
 
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
         Video._loadData(self, data)
         Playable._loadData(self, data)
         self._seasonNumber = None  # cached season number
-        self.art = data.attrib.get('art')
-        self.chapterSource = data.attrib.get('chapterSource')
-        self.contentRating = data.attrib.get('contentRating')
-        self.duration = utils.cast(int, data.attrib.get('duration'))
-        self.grandparentArt = data.attrib.get('grandparentArt')
-        self.grandparentKey = data.attrib.get('grandparentKey')
-        self.grandparentRatingKey = utils.cast(int, data.attrib.get('grandparentRatingKey'))
-        self.grandparentTheme = data.attrib.get('grandparentTheme')
-        self.grandparentThumb = data.attrib.get('grandparentThumb')
-        self.grandparentTitle = data.attrib.get('grandparentTitle')
-        self.guid = data.attrib.get('guid')
-        self.index = utils.cast(int, data.attrib.get('index'))
-        self.originallyAvailableAt = utils.toDatetime(data.attrib.get('originallyAvailableAt'), '%Y-%m-%d')
-        self.parentIndex = data.attrib.get('parentIndex')
-        self.parentKey = data.attrib.get('parentKey')
-        self.parentRatingKey = utils.cast(int, data.attrib.get('parentRatingKey'))
-        self.parentThumb = data.attrib.get('parentThumb')
-        self.parentTitle = data.attrib.get('parentTitle')
-        self.title = data.attrib.get('title')
-        self.rating = utils.cast(float, data.attrib.get('rating'))
-        self.viewOffset = utils.cast(int, data.attrib.get('viewOffset', 0))
-        self.year = utils.cast(int, data.attrib.get('year'))
-        self.directors = self.findItems(data, media.Director)
-        self.media = self.findItems(data, media.Media)
-        self.writers = self.findItems(data, media.Writer)
-        self.labels = self.findItems(data, media.Label)
-        self.collections = self.findItems(data, media.Collection)
 
     def __repr__(self):
         return '<%s>' % ':'.join([p for p in [
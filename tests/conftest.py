@@ -15,11 +15,13 @@
 # 3. A Photos section containing the photoalbums:
 #    Cats (with cute cat photos inside)
 # 4. A TV Shows section containing at least two seasons of The 100.
-import plexapi, pytest, requests
+import plexapi, pytest, re, requests, sys
 from plexapi import compat
 from plexapi.client import PlexClient
 from datetime import datetime
+from plexapi.paging import ContainerSizer
 from plexapi.server import PlexServer
+from plexapi.utils import parseXml
 from functools import partial
 
 SERVER_BASEURL = plexapi.CONFIG.get('auth.server_baseurl')
@@ -40,6 +42,9 @@ FRAMERATES = {'24p', 'PAL'}
 PROFILES = {'advanced simple', 'main', 'constrained baseline'}
 RESOLUTIONS = {'sd', '480', '576', '720', '1080'}
 
+# plexapi.aio requires Python 3.5+ syntax
+collect_ignore = ['test_aio.py'] if sys.version_info < (3, 5) else []
+
 
 def pytest_addoption(parser):
     parser.addoption('--client', action='store_true', default=False, help='Run client tests.')
@@ -143,6 +148,41 @@ def photoalbum(photos):
         return photos.get('photo_album1')
 
 
+@pytest.fixture()
+def paged_server():
+    """ Returns a function building a lazy PlexServer (no requests made) answering every key with
+        a container of total movies and episodes. Pages requested with X-Plex-Container-Start and
+        X-Plex-Container-Size are honored unless paging is False (the whole container is returned,
+        with totalSize unless totalSize is False). The keys requested are recorded in server.keys. Pages are read with
+        a fixed size of container_size items unless another ContainerSizer is set.
+    """
+    def _server(total, totalSize=True, paging=True, container_size=50):
+        server = PlexServer('http://localhost:32400', 'token', lazy=True)
+        server.keys = keys = []
+
+        def query(key, **kwargs):
+            keys.append(key)
+            start, size = 0, total
+            if paging:
+                start = int(re.search(r'X-Plex-Container-Start=(\d+)', key).group(1))
+                size = int(re.search(r'X-Plex-Container-Size=(\d+)', key).group(1))
+            video = '<Video ratingKey="%s" key="/library/metadata/%s" type="%s" title="Movie %s"/>'
+            items = ''.join(video % (i, i, 'movie' if i % 2 else 'episode', i)
+                for i in range(start, min(start + size, total)))
+            attrs = ' offset="%s"' % start + (' totalSize="%s"' % total if totalSize else '')
+            return parseXml(('<MediaContainer%s>%s</MediaContainer>' % (attrs, items)).encode('utf8'))
+
+        def queryPage(key):
+            data = query(key)
+            return data, 100 * len(data)
+
+        server.query = query
+        server._queryPage = queryPage
+        server._containerSizer = ContainerSizer(container_size, container_size, container_size)
+        return server
+    return _server
+
+
 @pytest.fixture()
 def monkeydownload(request, monkeypatch):
     monkeypatch.setattr('plexapi.utils.download', partial(plexapi.utils.download, mocked=True))
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+import asyncio
+from plexapi.aio import AsyncPlexServer
+from . import conftest as utils
+
+
+def _run(coro):
+    # asyncio.run() requires Python 3.7+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_aio_server(plex):
+    async def _test():
+        async with AsyncPlexServer(utils.SERVER_BASEURL, utils.SERVER_TOKEN) as aplex:
+            assert aplex.machineIdentifier == plex.machineIdentifier
+            assert aplex.plex.machineIdentifier == plex.machineIdentifier
+            sessions, history = await asyncio.gather(aplex.sessions(), aplex.history())
+            assert isinstance(sessions, list)
+            assert isinstance(history, list)
+    _run(_test())
+
+
+def test_aio_fetchItems(plex, movies):
+    async def _test():
+        async with AsyncPlexServer(utils.SERVER_BASEURL, utils.SERVER_TOKEN) as aplex:
+            key = '/library/sections/%s/all' % movies.key
+            items = await aplex.fetchItems(key)
+            assert [i.title for i in items] == [i.title for i in movies.all()]
+            movie = await aplex.fetchItem(key, title='Elephants Dream')
+            assert movie.__class__.__name__ == 'Movie'
+            assert movie._server is aplex.plex
+            assert movie.media[0].parts
+    _run(_test())
+
+
+def test_aio_search(plex, movie):
+    async def _test():
+        async with AsyncPlexServer(utils.SERVER_BASEURL, utils.SERVER_TOKEN) as aplex:
+            results = await aplex.search(movie.title)
+            assert movie.title in [r.title for r in results]
+    _run(_test())
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+import re
+import weakref
+from plexapi import utils
+from plexapi.base import Attr, PlexObject
+from plexapi.paging import ContainerSizer
+from plexapi.playlist import Playlist
+from plexapi.video import Movie
+
+PARTIAL = (b'<MediaContainer><Video ratingKey="1" key="/library/metadata/1" type="movie" title="One" '
+    b'viewCount="2" originallyAvailableAt="2017-01-02"><Media id="3"><Part id="4"><Stream streamType="2" '
+    b'codec="ac3"/></Part></Media><Genre tag="Drama"/></Video></MediaContainer>')
+FULL = (b'<MediaContainer><Video ratingKey="1" key="/library/metadata/1" type="movie" title="One Edited" '
+    b'studio="Studio"><Media id="3"/><Genre tag="Drama"/><Genre tag="Comedy"/></Video></MediaContainer>')
+
+
+class _Server(object):
+    _keepXml = True
+
+    def query(self, key):
+        return utils.parseXml(FULL)
+
+
+def _movie(server=None, keep_xml=None):
+    data = utils.parseXml(PARTIAL)
+    return PlexObject(server or _Server(), None).findItems(data, None, '/library/sections/1/all', keep_xml)[0]
+
+
+def test_base_Attr_lazy():
+    movie = _movie()
+    assert isinstance(movie, Movie)
+    assert 'title' not in movie.__dict__
+    assert movie.title == 'One'
+    assert movie.__dict__['title'] == 'One'
+    assert movie.viewCount == 2
+    assert movie.originallyAvailableAt.day == 2
+    assert movie.listType == 'video'
+    assert [g.tag for g in movie.genres] == ['Drama']
+    assert movie.media[0].parts[0].streams[0].codec == 'ac3'
+    assert movie.media[0].parts[0].streams[0].type == 2
+    assert isinstance(Movie.title, Attr)
+
+
+def test_base_Attr_reload():
+    movie = _movie()
+    assert movie.title == 'One'
+    assert movie.originallyAvailableAt is not None
+    assert len(movie.genres) == 1
+    movie.reload()
+    assert movie.title == 'One Edited'
+    assert movie.studio == 'Studio'
+    assert len(movie.genres) == 2
+    # values missing from the reloaded data are kept
+    assert movie.originallyAvailableAt.year == 2017
+
+
+def test_base_Items_single_pass():
+    movie = _movie()
+    assert 'media' not in movie.__dict__
+    assert [g.tag for g in movie.genres] == ['Drama']
+    # the other lists are built in the same pass over the children
+    assert len(movie.__dict__['media']) == 1
+    assert movie.__dict__['roles'] == []
+    assert movie.__dict__['usernames'] == []
+
+
+def test_base_firstAttr():
+    movie = _movie()
+    assert movie.firstAttr('art', 'title') == 'One'
+    assert repr(movie) == '<Movie:1:One>'
+    movie._decodeAttrs()
+    assert movie.__dict__['viewCount'] == 2
+
+
+def test_base_keep_xml():
+    movie = _movie(keep_xml=False)
+    assert movie._data is None
+    assert movie.media[0]._data is None
+    assert movie.media[0].parts[0].streams[0]._data is None
+    assert movie.title == 'One'
+    assert movie.viewCount == 2
+    assert [g.tag for g in movie.genres] == ['Drama']
+    assert movie.media[0].parts[0].streams[0].codec == 'ac3'
+    assert 'art' not in movie.__dict__
+    assert movie.firstAttr('art', 'title') == 'One'
+    # missing values trigger a reload which fetches the xml again
+    assert movie.studio == 'Studio'
+    assert movie._data is None
+    assert movie.title == 'One Edited'
+    assert len(movie.genres) == 2
+
+
+def test_base_keep_xml_server():
+    server = _Server()
+    server._keepXml = False
+    assert _movie(server)._data is None
+    assert _movie(server, keep_xml=True)._data is not None
+
+
+def test_base_compileFilter():
+    elem = utils.parseXml(PARTIAL)[0]
+    obj = PlexObject(None, None)
+    assert obj._compileFilter(type='movie', viewCount__gte=2, genre__tag__iexact='drama')(elem)
+    assert obj._compileFilter(Title='One', etag='Video', media__part__id=4)(elem)
+    assert not obj._compileFilter(type='movie', viewCount__gt=2)(elem)
+    assert obj._compileFilter(studio=None)(elem)
+    assert not obj._compileFilter(studio__exists=True)(elem)
+    assert obj.listAttrs(utils.parseXml(FULL)[0], 'tag', etag='Genre') == ['Drama', 'Comedy']
+
+
+def test_base_internKey():
+    server = _Server()
+    server._tags = weakref.WeakValueDictionary()
+    movie, other = _movie(server), _movie(server)
+    assert movie.genres[0] is other.genres[0]
+    assert movie.genres[0].tag == 'Drama'
+    assert movie.genres[0]._data is None
+    assert movie.media[0].parts[0].streams[0].codec is other.media[0].parts[0].streams[0].codec
+    # tags are not shared between servers, nor without a server keeping them
+    assert _movie().genres[0] is not movie.genres[0]
+    hub = utils.parseXml(b'<Genre id="1" tag="Drama" key="/library/sections/1/all?genre=1"/>')
+    assert PlexObject(server, None)._buildItem(hub) is not PlexObject(server, None)._buildItem(hub)
+    # tags differing by any attribute, or without id and tag, are not shared
+    build = lambda xml: PlexObject(server, None)._buildItem(utils.parseXml(xml))
+    role = build(b'<Role id="2" tag="Actor" role="Hero" thumb="/a.jpg"/>')
+    assert build(b'<Role id="2" tag="Actor" role="Hero" thumb="/a.jpg"/>') is role
+    assert build(b'<Role id="2" tag="Actor" role="Villain"/>').role == 'Villain'
+    assert build(b'<Role id="2" tag="Actor" role="Hero"/>') is not role
+    assert build(b'<Genre/>') is not build(b'<Genre/>')
+
+
+def test_base_fetchItems_paging(paged_server):
+    server = paged_server(95)
+    obj = PlexObject(server, None)
+    items = obj.fetchItems('/status/sessions/history/all?sort=viewedAt', container_size=10)
+    assert [item.ratingKey for item in items] == list(range(95))
+    assert len(server.keys) == 10 and server.keys[1].endswith('?sort=viewedAt&X-Plex-Container-Start=10&X-Plex-'
+        'Container-Size=10')
+    # filtered items are counted once built, more pages are read until maxresults match
+    del server.keys[:]
+    items = obj.fetchItems('/history', container_size=10, maxresults=12, type='movie')
+    assert [item.ratingKey for item in items] == list(range(1, 25, 2))
+    assert len(server.keys) >= 3
+    assert [item.ratingKey for item in obj.iterItems('/history', maxresults=7)] == list(range(7))
+
+
+def test_base_fetchItems_paging_ignored(paged_server):
+    # a server returning the whole container is only requested once, with or without totalSize
+    for totalSize in (True, False):
+        server = paged_server(95, totalSize, paging=False)
+        assert len(PlexObject(server, None).fetchItems('/sessions', container_size=10)) == 95
+        assert len(server.keys) == 1
+    # pages from another offset than requested or empty pages stop the paging
+    server = paged_server(95)
+    query = server.query
+    server.query = lambda key, **kwargs: query(re.sub(r'Start=\d+', 'Start=0', key))
+    assert len(PlexObject(server, None).fetchItems('/sessions', container_size=10)) == 10
+    server.query = lambda key, **kwargs: query(re.sub(r'Start=[5-9]\d', 'Start=95', key))
+    items = PlexObject(server, None).fetchItems('/sessions', container_size=10)
+    assert [item.ratingKey for item in items] == list(range(50))
+
+
+def test_base_fetchItems_paging_adaptive(paged_server):
+    server = paged_server(1000)
+    server._containerSizer = ContainerSizer(10, 10, 400, latency=1.0)
+    items = PlexObject(server, None).fetchItems('/status/sessions/history/all', maxresults=999999)
+    assert [item.ratingKey for item in items] == list(range(1000))
+    # the page size grows from the measured pages, up to the max size
+    sizes = [int(key.rsplit('=', 1)[1]) for key in server.keys]
+    assert sizes[0] == 10 and max(sizes) <= 400 and len(sizes) < 100
+    assert sorted(sizes) == sorted(stats.size for stats in server._containerSizer.stats)
+    # an explicit container_size is not adapted
+    del server.keys[:]
+    assert len(PlexObject(server, None).fetchItems('/history', container_size=100)) == 1000
+    assert len(server.keys) == 10
+
+
+def test_base_Playlist_reload():
+    class Server(_Server):
+        def query(self, key):
+            return utils.parseXml(b'<MediaContainer><Playlist ratingKey="5" key="/playlists/5/items" '
+                b'type="playlist" title="Edited" playlistItemID="9"/></MediaContainer>')
+    data = utils.parseXml(b'<MediaContainer><Playlist ratingKey="5" key="/playlists/5/items" type="playlist" '
+        b'title="Mix" sessionKey="7" playlistItemID="8"/></MediaContainer>')
+    playlist = PlexObject(Server(), None).findItems(data, None, '/playlists')[0]
+    assert isinstance(playlist, Playlist)
+    assert playlist.sessionKey == 7
+    assert playlist.playlistItemID == 8
+    playlist.reload()
+    assert playlist.title == 'Edited'
+    assert playlist._data.attrib['title'] == 'Edited'
+    # lazy attributes read before are refreshed from the new data, or kept if it has none
+    assert playlist.playlistItemID == 9
+    assert playlist.sessionKey == 7
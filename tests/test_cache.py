@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+import gc
+import pytest
+from plexapi.base import PlexObject
+from plexapi.cache import ConnectionCache, DiskCache, IdentityMap, MemoryCache, ServerSnapshot
+from plexapi.compat import ElementTree
+from plexapi.exceptions import BadRequest
+from plexapi.server import PlexServer
+from plexapi.utils import parseXml
+
+CONTENT = b'<MediaContainer size="1"><Directory key="1" title="Movies"/></MediaContainer>'
+
+
+class _Response(object):
+    def __init__(self, headers, content=CONTENT, status_code=200):
+        self.headers = headers
+        self.content = content
+        self.status_code = status_code
+        self.url = self.text = ''
+
+
+def test_cache_MemoryCache():
+    cache = MemoryCache(maxsize=2)
+    data = ElementTree.fromstring(CONTENT)
+    cache.set('/a', _Response({'ETag': '"1"'}), data)
+    cache.set('/b', _Response({'Last-Modified': 'Sat, 01 Jan 2000 00:00:00 GMT'}), data)
+    cache.set('/c', _Response({}), data)
+    assert cache.get('/a') == ({'If-None-Match': '"1"'}, data)
+    assert cache.get('/c') is None
+    cache.set('/d', _Response({'ETag': '"2"'}), data)
+    assert len(cache) == 2
+    assert cache.get('/b') is None
+    assert cache.get('/a')[1] is data
+    # the responses of a url in xml and json are cached separately
+    assert cache.get('/a', 'json') is None
+    cache.set('/a', _Response({'ETag': '"3"'}), None, 'json')
+    assert cache.get('/a', 'json') == ({'If-None-Match': '"3"'}, None)
+    assert cache.get('/a')[1] is data
+    cache.clear()
+    assert cache.get('/a') is None
+
+
+def test_cache_DiskCache(tmpdir):
+    cache = DiskCache(str(tmpdir))
+    cache.set('/a', _Response({'ETag': '"1"', 'Last-Modified': 'Sat, 01 Jan 2000 00:00:00 GMT'}), None)
+    validators, data = DiskCache(str(tmpdir)).get('/a')
+    assert validators['If-None-Match'] == '"1"'
+    assert validators['If-Modified-Since'] == 'Sat, 01 Jan 2000 00:00:00 GMT'
+    assert data[0].attrib['title'] == 'Movies'
+    # the files hold the validators as json followed by the raw body
+    with open(cache._filepath('/a', 'xml'), 'rb') as handle:
+        assert handle.read().split(b'\n', 1)[1] == CONTENT
+    cache.set('/a', _Response({'ETag': '"2"'}, b'{"MediaContainer": {"size": 0}}'), None, 'json')
+    assert cache.get('/a', 'json')[1].attrib == {'size': '0'}
+    assert cache.get('/a')[1][0].attrib['title'] == 'Movies'
+    cache.clear()
+    assert cache.get('/a') is None
+
+
+def test_cache_PlexServer_notModified():
+    responses, sent = [_Response({}, b'', 304), _Response({'ETag': '"1"'}), _Response({}, b'', 304)], []
+
+    class Session(object):
+        def get(self, url, headers, timeout):
+            sent.append(headers.get('If-None-Match'))
+            return responses.pop(0)
+    server = PlexServer('http://localhost:32400', 'token', Session(), cache=MemoryCache(), lazy=True)
+    # 304 Not Modified is only a success for a request sent with the validators of the cache
+    with pytest.raises(BadRequest):
+        server.query('/library/sections')
+    assert server.query('/library/sections')[0].attrib['title'] == 'Movies'
+    assert server.query('/library/sections')[0].attrib['title'] == 'Movies'
+    assert sent == [None, None, '"1"']
+    assert (server._cache.hits, server._cache.misses) == (1, 1)
+
+
+def test_cache_ConnectionCache(tmpdir):
+    path = str(tmpdir.join('connections.json'))
+    cache = ConnectionCache(path, ttl=60)
+    assert cache.get('abc') is None
+    cache.set('abc', 'Server', 'server', 'https://1-2-3-4.abc.plex.direct:32400', 'token', 0.25)
+    entry = ConnectionCache(path, ttl=60).get('Server')
+    assert entry['clientIdentifier'] == 'abc'
+    assert entry['uri'] == 'https://1-2-3-4.abc.plex.direct:32400'
+    assert cache.get('abc')['latency'] == 0.25
+    assert ConnectionCache(path, ttl=-1).get('abc') is None
+    cache.remove('abc')
+    assert cache.get('abc') is None
+
+
+def test_cache_ServerSnapshot(tmpdir):
+    snapshot = ServerSnapshot(str(tmpdir.join('servers.json')))
+    assert snapshot.get('http://localhost:32400') is None
+    snapshot.set('http://localhost:32400', {'machineIdentifier': 'abc', 'version': '1.0'})
+    snapshot.set('http://localhost:32400', {'machineIdentifier': 'def', 'version': '1.1'})
+    attrib = ServerSnapshot(str(tmpdir.join('servers.json'))).get('http://localhost:32400')
+    assert attrib == {'machineIdentifier': 'def', 'version': '1.1'}
+    assert snapshot.get('http://localhost:32400', 'def') == attrib
+    assert snapshot.get('http://localhost:32400', 'abc') is None
+
+
+def test_cache_IdentityMap():
+    class Server(object):
+        machineIdentifier = 'abc'
+        _identityMap = IdentityMap()
+
+    search = parseXml(b'<MediaContainer><Video ratingKey="1" key="/library/metadata/1" type="movie" title="One"/>'
+        b'<Video ratingKey="2" key="/library/metadata/2" type="movie" title="Two"/></MediaContainer>')
+    full = parseXml(b'<MediaContainer><Video ratingKey="1" key="/library/metadata/1" type="movie" title="One" '
+        b'studio="Studio"/></MediaContainer>')
+    history = parseXml(b'<MediaContainer><Video ratingKey="1" key="/library/metadata/1" type="movie" '
+        b'viewedAt="1500000000"/><Video ratingKey="1" key="/library/metadata/1" type="movie" '
+        b'viewedAt="1500000001"/></MediaContainer>')
+    obj = PlexObject(Server(), None)
+    items = obj.findItems(search, initpath='/search')
+    assert len(Server._identityMap) == 2
+    assert obj.findItems(search, initpath='/hubs')[0] is items[0]
+    assert obj.findItems(full, initpath='/library/metadata/1')[0] is items[0]
+    assert items[0].isFullObject() and items[0].studio == 'Studio'
+    # partial data does not downgrade the full object, its attributes are merged
+    assert obj.findItems(search, initpath='/search')[0].isFullObject()
+    watched = parseXml(b'<MediaContainer><Video ratingKey="1" key="/library/metadata/1" type="movie" '
+        b'title="One" viewCount="3"/></MediaContainer>')
+    assert items[0].viewCount == 0
+    assert obj.findItems(watched, initpath='/library/onDeck')[0] is items[0]
+    assert items[0].isFullObject() and items[0].viewCount == 3 and items[0].studio == 'Studio'
+    # also into objects which dropped their xml (keep_xml=False)
+    other = PlexObject(type('Server', (Server,), {'_identityMap': IdentityMap()})(), None)
+    released = other.findItems(full, initpath='/library/metadata/1', keep_xml=False)[0]
+    assert other.findItems(watched, initpath='/library/onDeck', keep_xml=False)[0] is released
+    assert released._data is None and released.viewCount == 3 and released.studio == 'Studio'
+    del other, released
+    # history entries are kept apart
+    entries = obj.findItems(history, initpath='/status/sessions/history/all')
+    assert entries[0] is not items[0] and entries[0] is not entries[1]
+    del items, entries
+    gc.collect()
+    assert len(Server._identityMap) == 0
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import pytest, time
+from threading import Lock
+from plexapi.exceptions import NotFound
+from plexapi.executor import Executor, TimeoutError, getExecutor
+
+
+def test_executor_bounded():
+    executor, lock, running = Executor(max_workers=2), Lock(), [0, 0]
+
+    def _task(num):
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        return num * num
+    assert executor.map(_task, [[i] for i in range(6)]) == [0, 1, 4, 9, 16, 25]
+    assert running[1] <= 2
+    executor.shutdown()
+
+
+def test_executor_exception():
+    def _task(num):
+        if num == 2:
+            raise NotFound('missing %s' % num)
+        return num
+    with pytest.raises(NotFound):
+        getExecutor().map(_task, [[1], [2], [3]])
+
+
+def test_executor_timeout():
+    executor = Executor(max_workers=1)
+    with pytest.raises(TimeoutError):
+        executor.map(time.sleep, [[0.5], [0.5], [0.5]], timeout=0.1)
+    executor.shutdown()
+
+
+def test_executor_nested():
+    # all workers waiting on nested tasks must not deadlock
+    executor = Executor(max_workers=1)
+    outer = lambda num: executor.map(lambda n: n + 1, [[num]])[0]
+    assert executor.map(outer, [[1], [2]], timeout=5) == [2, 3]
+    executor.shutdown()
+
+
+def test_executor_imap():
+    executor, started = Executor(max_workers=4), []
+
+    def _task(num):
+        started.append(num)
+        time.sleep(0.02 * (5 - num % 5))
+        return num * num
+    assert list(executor.imap(_task, ([i] for i in range(10)), window=3)) == [i * i for i in range(10)]
+    # only window calls are submitted ahead, closing the generator cancels them
+    del started[:]
+    results = executor.imap(_task, [[i] for i in range(10)], window=2)
+    assert next(results) == 0
+    results.close()
+    time.sleep(0.2)
+    assert len(started) <= 3
+    executor.shutdown()
+
+
+def test_executor_daemon():
+    # a hung task does not hold up the exit of the interpreter
+    executor = Executor(max_workers=2)
+    assert executor.submit(time.sleep, 0.01).result(timeout=1) is None
+    assert all(thread.daemon for thread in executor._threads)
+    executor.shutdown()
+    with pytest.raises(RuntimeError):
+        executor.submit(time.sleep, 0)
@@ -1,6 +1,11 @@
 # -*- coding: utf-8 -*-
+import re
+import time
 import pytest
 from plexapi.exceptions import NotFound
+from plexapi.library import Library, MovieSection
+from plexapi.server import PlexServer
+from plexapi.utils import parseXml
 from . import conftest as utils
 
 
@@ -74,6 +79,16 @@ def test_library_search(plex):
     assert item.title == 'Elephants Dream'
 
 
+def test_library_iterItems(plex, movies):
+    key = '/library/sections/%s/all' % movies.key
+    items = plex.iterItems(key)
+    first = next(items)
+    assert first.title
+    titles = [first.title] + [m.title for m in items]
+    assert titles == [m.title for m in plex.fetchItems(key)]
+    assert [m.title for m in plex.iterItems(key, title='Elephants Dream')] == ['Elephants Dream']
+
+
 def test_library_add_edit_delete(plex):
     # Dont add a location to prevent scanning scanning
     section_name = 'plexapi_test_section'
@@ -203,3 +218,66 @@ def test_crazy_search(plex, movie):
     assert movie in movies.search(year=['2006', '2007']), 'Unable to search movie by year.'
     assert movie not in movies.search(year=2007), 'Unable to filter movie by year.'
     assert movie in movies.search(actor=movie.actors[0].tag)
+
+
+@pytest.mark.parametrize('totalSize', [True, False])
+def test_library_MovieSection_search_pages(paged_server, totalSize):
+    server = paged_server(120, totalSize)
+    keys = server.keys
+    section = MovieSection(server, parseXml(b'<Directory key="1" type="movie" title="Movies"/>'), '/library/sections')
+    results = section.search()
+    assert [item.ratingKey for item in results] == list(range(120))
+    assert len(keys) == 3  # without totalSize, until a page that is not full
+    del keys[:]
+    results = section.search(maxresults=70)
+    assert [item.ratingKey for item in results] == list(range(70))
+    assert len(keys) == 2
+    assert section.search(maxresults=0) == []
+
+
+def test_library_MovieSection_iterSearch(paged_server):
+    server = paged_server(500)
+    keys = server.keys
+    section = MovieSection(server, parseXml(b'<Directory key="1" type="movie" title="Movies"/>'), '/library/sections')
+    assert [item.ratingKey for item in section.iterSearch(maxresults=120)] == list(range(120))
+    del keys[:]
+    for item in section.iterSearch():
+        if item.ratingKey == 60:
+            break
+    # the pages after the next one are never requested
+    assert len(keys) <= 3
+
+
+def _sectionsServer(sizes, broken=()):
+    keys = []
+
+    def query(key, **kwargs):
+        keys.append(key)
+        if key == '/library/sections':
+            directories = ''.join('<Directory key="%s" type="movie" title="Section %s"/>' % (i, i)
+                for i in range(1, len(sizes) + 1))
+            return parseXml(('<MediaContainer>%s</MediaContainer>' % directories).encode('utf8'))
+        section = int(re.match(r'/library/sections/(\d+)/all', key).group(1))
+        if section in broken:
+            raise NotFound('section %s' % section)
+        time.sleep(0.02 * (len(sizes) - section))  # the first sections are the slowest
+        items = ''.join('<Video ratingKey="%s%02d" key="/library/metadata/%s" type="movie" title="Movie"/>'
+            % (section, i, i) for i in range(sizes[section - 1]))
+        return parseXml(('<MediaContainer>%s</MediaContainer>' % items).encode('utf8'))
+
+    server = PlexServer('http://localhost:32400', 'token', lazy=True)
+    server.query = query
+    server.iterQuery = lambda key: iter(query(key))
+    server._queryPage = lambda key: (query(key), 1000)
+    return Library(server, parseXml(b'<MediaContainer/>')), keys
+
+
+def test_library_Library_all_concurrent():
+    library, keys = _sectionsServer([3, 2, 4, 1], broken=(3,))
+    expected = [100, 101, 102, 200, 201, 400]
+    # grouped by section in order, the broken section is skipped
+    assert [item.ratingKey for item in library.all()] == expected
+    assert len(keys) == 5
+    items = [item.ratingKey for item in library.iterAll(interleave=True, window=2)]
+    assert sorted(items) == expected and items != expected
+    assert [item.ratingKey for item in library.all(maxresults=1)] == [100, 200, 400]
@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+import pytest, threading, time
+from plexapi.exceptions import NotFound
+from plexapi.myplex import _raceConnections
 
 
 def test_myplex_accounts(account, plex):
@@ -67,3 +70,22 @@ def test_myplex_users(account):
     user = account.user(users[0].title)
     print('Found user: %s' % user)
     assert user, 'Could not find user %s' % users[0].title
+
+
+def test_myplex_raceConnections():
+    class _Device(object):
+        # url is 'delay:ok' where delay is the seconds to respond
+        def __init__(self, baseurl, token, timeout):
+            delay, ok = baseurl.split(':')
+            time.sleep(float(delay))
+            if ok != 'ok':
+                raise NotFound(baseurl)
+            self._baseurl, self._token = baseurl, token
+    starttime = time.time()
+    device = _raceConnections('Device', 'test', _Device, ['0.2:err', '0.1:ok', '0.05:ok', '3:ok'], 'token', None)
+    assert device._baseurl == '0.1:ok'
+    assert time.time() - starttime < 1
+    # the abandoned attempt runs on its own daemon thread, not on a worker of the executor
+    assert [thread.daemon for thread in threading.enumerate() if thread.name == 'plexapi-_connect'] == [True]
+    with pytest.raises(NotFound):
+        _raceConnections('Device', 'test', _Device, ['0:err', '0.1:err'], 'token', None)
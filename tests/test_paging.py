@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+from plexapi.paging import ContainerSizer
+
+
+def test_paging_ContainerSizer_grow():
+    sizer = ContainerSizer(50, 10, 1000, latency=1.0)
+    # 50 items of 1000 bytes read in 0.1s: 500 items fit in 1s, grown at most 2x per page
+    assert sizer.update(50, 50, 50000, 0.1) == 100
+    assert sizer.update(100, 100, 100000, 0.2) == 200
+    assert sizer.update(200, 200, 200000, 0.4) == 400
+    assert sizer.update(400, 400, 400000, 0.8) == 500
+    assert sizer.update(500, 500, 500000, 1.0) == 500
+    assert [stats.nextsize for stats in sizer.stats] == [100, 200, 400, 500, 500]
+    assert sizer.stats[0].bytes == 50000
+
+
+def test_paging_ContainerSizer_shrink_bounds():
+    sizer = ContainerSizer(50, 10, 60, latency=1.0)
+    assert sizer.update(50, 50, 50000, 0.01) == 60
+    # a slow server halves the page size at each page, down to the min size
+    sizer = ContainerSizer(50, 20, 1000, latency=1.0)
+    assert sizer.update(50, 50, 50000, 5.0) == 25
+    assert sizer.update(25, 25, 25000, 5.0) == 20
+    # empty pages and unmeasured responses do not change the size
+    assert sizer.update(20, 0, 100, 0.5) == 20
+    assert sizer.update(20, 20, None, 0.5) == 20
+    assert len(sizer.stats) == 4
+    assert ContainerSizer(5000, 10, 1000).size == 1000
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+import io
+import pickle
+import pytest
+from plexapi import parser, utils
+from plexapi.base import PlexObject
+from plexapi.exceptions import Unsupported
+
+CONTENT = (u'<?xml version="1.0" encoding="UTF-8"?>\n<MediaContainer size="2">'
+    u'<Video ratingKey="1" title="Café"><Genre tag="Drama"/><Genre tag="Comedy"/></Video>'
+    u'<Video ratingKey="2" title="Two"><Media id="3"><Part id="4"/></Media></Video>'
+    u'</MediaContainer>\n').encode('utf8')
+
+
+@pytest.fixture(params=sorted(parser.PARSERS))
+def backend(request):
+    try:
+        yield parser.setParser(request.param)
+    except Unsupported:
+        pytest.skip('%s parser not available' % request.param)
+    finally:
+        parser.setParser()
+
+
+def test_parser_fromstring(backend):
+    data = utils.parseXml(CONTENT)
+    assert data.tag == 'MediaContainer'
+    assert len(data) == 2
+    assert data[0].attrib['title'] == u'Café'
+    assert dict(data[0].attrib) == {'ratingKey': '1', 'title': u'Café'}
+    assert [e.get('tag') for e in data[0]] == ['Drama', 'Comedy']
+    assert data.find('Video').get('ratingKey') == '1'
+    assert [e.get('id') for e in data.iter('Part')] == ['4']
+
+
+def test_parser_iterparse(backend):
+    root, titles = None, []
+    for event, elem in backend.iterparse(io.BytesIO(CONTENT)):
+        root = elem if root is None else root
+        if event == 'end' and elem.tag == 'Video':
+            titles.append(elem.get('title'))
+    assert titles == [u'Café', 'Two']
+    assert root.tag == 'MediaContainer'
+
+
+def test_parser_default():
+    # lxml is opt-in: objects built from the default parser can be pickled
+    assert parser.setParser().name == 'etree'
+    from plexapi import video  # noqa: F401
+    data = utils.parseXml(b'<MediaContainer><Video ratingKey="1" type="movie" title="One"/></MediaContainer>')
+    movie = PlexObject(None, None).findItems(data)[0]
+    assert pickle.loads(pickle.dumps(movie)).title == 'One'
+
+
+def test_parser_unknown():
+    with pytest.raises(Unsupported):
+        parser.setParser('sax')
+
+
+def test_parser_parseJson():
+    from plexapi import video  # noqa: F401
+    from plexapi.base import PlexObject
+    content = (u'{"MediaContainer": {"size": 2, "allowSync": true, "Metadata": ['
+        u'{"ratingKey": "1", "key": "/library/metadata/1", "type": "movie", "title": "Café", "year": 2017,'
+        u' "rating": 7.4, "Media": [{"id": 3, "Part": [{"id": 4, "file": "/m/1.mkv"}]}],'
+        u' "Genre": [{"tag": "Drama"}, {"tag": "Comedy"}]},'
+        u'{"ratingKey": "2", "key": "/library/metadata/2", "type": "show", "title": "Show"}]}}').encode('utf8')
+    data = parser.parseJson(content)
+    assert data.tag == 'MediaContainer'
+    assert data.attrib == {'size': '2', 'allowSync': '1'}
+    assert [elem.tag for elem in data] == ['Video', 'Directory']
+    movie, show = PlexObject(None, None).findItems(data)
+    assert (movie.TYPE, movie.title, movie.year, movie.rating) == ('movie', u'Café', 2017, 7.4)
+    assert [genre.tag for genre in movie.genres] == ['Drama', 'Comedy']
+    assert movie.media[0].parts[0].file == '/m/1.mkv'
+    assert show.TYPE == 'show'
+    assert parser.parseJson(b'') is None
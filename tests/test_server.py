@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 import pytest, re, time
-from plexapi.exceptions import BadRequest, NotFound
+from plexapi.cache import ServerSnapshot
+from plexapi.exceptions import BadRequest, NotFound, Unsupported
 from plexapi.server import PlexServer
+from plexapi import utils as utils_
 from plexapi.utils import download
 from PIL import Image, ImageStat
 from requests import Session
@@ -131,6 +133,84 @@ def test_server_Server_query(plex):
         PlexServer(utils.SERVER_BASEURL, '1234')
 
 
+def test_server_Server_format_json(plex, movies):
+    jplex = PlexServer(utils.SERVER_BASEURL, utils.SERVER_TOKEN, format='json')
+    assert jplex.machineIdentifier == plex.machineIdentifier
+    section = jplex.library.section(movies.title)
+    assert [m.title for m in section.all()] == [m.title for m in movies.all()]
+    with pytest.raises(Unsupported):
+        PlexServer(utils.SERVER_BASEURL, utils.SERVER_TOKEN, format='yaml')
+
+
+def test_server_Server_lazy(plex, tmpdir):
+    lazy = PlexServer(utils.SERVER_BASEURL, utils.SERVER_TOKEN, lazy=True)
+    assert lazy._data is None
+    assert lazy.machineIdentifier == plex.machineIdentifier
+    assert lazy._data is not None
+    snapshot = ServerSnapshot(str(tmpdir.join('servers.json')))
+    PlexServer(utils.SERVER_BASEURL, utils.SERVER_TOKEN, lazy=True, snapshot=snapshot).version
+    assert snapshot.get(utils.SERVER_BASEURL)['machineIdentifier'] == plex.machineIdentifier
+    lazy = PlexServer(utils.SERVER_BASEURL, utils.SERVER_TOKEN, lazy=True, snapshot=snapshot)
+    assert lazy._data is not None
+    assert lazy.version == plex.version
+
+
+def test_server_Server_lazy_offline(tmpdir, monkeypatch):
+    roots = ['<MediaContainer machineIdentifier="def" version="1.1"/>', None]
+    monkeypatch.setattr(PlexServer, 'query', lambda self, key, timeout=None: roots[0] and utils_.parseXml(
+        roots[0].encode('utf8')))
+    submitted = []
+    monkeypatch.setattr('plexapi.server.getExecutor', lambda: type('Executor', (), {'submit': submitted.append})())
+    baseurl = 'http://offline:32400'
+    snapshot = ServerSnapshot(str(tmpdir.join('servers.json')))
+    snapshot.set(baseurl, {'machineIdentifier': 'abc', 'version': '1.0'})
+    server = PlexServer(baseurl, 'token', lazy=True, snapshot=snapshot)
+    assert (server.machineIdentifier, submitted) == ('abc', [server._revalidateRoot])
+    server._library = 'library of abc'
+    server._revalidateRoot()
+    # another server answers on baseurl: root attributes, cached library and snapshot refreshed
+    assert (server.machineIdentifier, server.version, server._library) == ('def', '1.1', None)
+    assert snapshot.get(baseurl, 'abc') is None
+    assert snapshot.get(baseurl, 'def')['version'] == '1.1'
+    roots.pop(0)
+    with pytest.raises(BadRequest):
+        server._loadRoot()
+
+
+def test_server_hydrate(plex, movies):
+    items = movies.all()
+    assert all(item.isPartialObject() for item in items)
+    plex.hydrate(items, maxlength=40)
+    assert all(item.isFullObject() for item in items)
+    assert movies.fetchItems(movies.key + '/all', full=True)[0].isFullObject()
+
+
+def test_server_hydrate_offline():
+    keys = []
+
+    def query(key):
+        keys.append(key)
+        ids = key.rsplit('/', 1)[1].split(',')
+        return utils_.parseXml(('<MediaContainer>%s</MediaContainer>' % ''.join('<Video ratingKey="%s" '
+            'key="/library/metadata/%s" type="movie" title="Full %s" studio="Studio"/>' % (i, i, i)
+            for i in ids)).encode('utf8'))
+
+    server = PlexServer('http://localhost:32400', 'token', lazy=True)
+    server.query = query
+    data = utils_.parseXml(('<MediaContainer>%s</MediaContainer>' % ''.join('<Video ratingKey="%s" '
+        'key="/library/metadata/%s" type="movie" title="Partial %s"/>' % (i, i, i)
+        for i in range(100))).encode('utf8'))
+    items = server.findItems(data, initpath='/library/sections/1/all')
+    assert server.hydrate(items, maxlength=100) is items
+    assert len(keys) > 1 and all(len(key) <= 100 for key in keys)
+    assert sorted(int(i) for key in keys for i in key.rsplit('/', 1)[1].split(',')) == list(range(100))
+    assert all(item.isFullObject() for item in items)
+    assert items[42].title == 'Full 42' and items[42].studio == 'Studio'
+    requests = len(keys)
+    server.hydrate(items)
+    assert len(keys) == requests  # full objects are not requested again
+
+
 def test_server_Server_session():
     # Mock Sesstion
     class MySession(Session):
@@ -248,3 +328,17 @@ def test_server_downloadLogs(tmpdir, plex):
 def test_server_downloadDatabases(tmpdir, plex):
     plex.downloadDatabases(savepath=str(tmpdir), unpack=True)
     assert len(tmpdir.listdir()) > 1
+
+
+def test_server_Server_lazy_attrs():
+    server = PlexServer('http://localhost:32400', 'token', lazy=True)
+    server.query = lambda key, **kwargs: utils_.parseXml(b'<MediaContainer friendlyName="Plex" version="1.0"/>')
+    # unknown attributes raise AttributeError without fetching the root attributes
+    assert not hasattr(server, 'frendlyName')
+    assert getattr(server, 'versions', None) is None
+    assert server._data is None
+    assert server.friendlyName == 'Plex'
+    assert server._data is not None
+    # the root attributes are the ones set by _loadData()
+    loaded = set(attr for attr in server.__dict__ if not attr.startswith('_')) - set(['query'])
+    assert loaded == PlexServer._ROOTATTRS
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import pytest, time
+import plexapi
 import plexapi.utils as utils
 from plexapi.exceptions import NotFound
 
@@ -60,6 +61,23 @@ def test_utils_cast():
         bool_str = utils.cast(bool, 'kek')
 
 
+def test_utils_internStr():
+    value = ''.join(['a', 'c', '3'])
+    assert utils.internStr(value) is utils.internStr('ac3')
+    assert utils.internStr(None) is None
+
+
+def test_utils_getSession():
+    session = utils.getSession()
+    assert session is utils.getSession()
+    adapter = session.get_adapter('http://localhost:32400')
+    assert adapter is session.get_adapter('https://plex.tv')
+    assert adapter.max_retries.total == plexapi.CONFIG.get('plexapi.max_retries', 3, int)
+    assert 502 in adapter.max_retries.status_forcelist
+    assert 503 in adapter.max_retries.status_forcelist
+    assert adapter._pool_maxsize == plexapi.CONFIG.get('plexapi.pool_maxsize', 32, int)
+
+
 def test_utils_download(episode):
     url = episode.getStreamURL()
     locations = episode.locations[0]
@@ -67,3 +85,51 @@ def test_utils_download(episode):
     assert utils.download(url, filename=locations, mocked=True)
     assert utils.download(url, filename=locations, session=session, mocked=True)
     assert utils.download(episode.thumbUrl, filename=episode.title, mocked=True)
+
+
+def test_utils_parseXml():
+    assert utils.parseXml(b'') is None
+    assert utils.parseXml(b' \n') is None
+    data = utils.parseXml(u'<?xml version="1.0" encoding="UTF-8"?>\n<MediaContainer title="Café"/>\n'.encode('utf8'))
+    assert data.attrib['title'] == u'Café'
+
+
+def test_utils_SingleFlight():
+    from threading import Event, Thread
+    flight, started, release, calls, results = utils.SingleFlight(), Event(), Event(), [], []
+
+    def slow(value):
+        calls.append(value)
+        started.set()
+        release.wait(5)
+        return value
+
+    leader = Thread(target=lambda: results.append(flight.do('key', slow, 1)))
+    leader.start()
+    started.wait(5)
+    followers = [Thread(target=lambda: results.append(flight.do('key', slow, 2))) for _ in range(8)]
+    for thread in followers:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in [leader] + followers:
+        thread.join()
+    assert calls == [1]
+    assert results == [1] * 9
+    assert flight.do('key', slow, 3) == 3
+    with pytest.raises(NotFound):
+        flight.do('key', utils.searchType, 'unknown')
+
+
+def test_utils_getPlexObject():
+    from plexapi.video import Movie
+    assert utils.getPlexObject('Video.movie', 'Video') is Movie
+    assert utils.getPlexObject('Unknown.type', 'Unknown') is None
+
+
+def test_utils_lazy_headers():
+    headers = plexapi.BASE_HEADERS
+    assert headers['X-Plex-Client-Identifier'] == plexapi.X_PLEX_IDENTIFIER
+    assert headers['X-Plex-Platform'] == plexapi.X_PLEX_PLATFORM
+    with pytest.raises(AttributeError):
+        plexapi.X_PLEX_UNKNOWN
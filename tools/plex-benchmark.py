@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Plex-Benchmark is used during development of PlexAPI to measure the cost of the
+request and parsing paths against synthetic responses, so no Plex server is
+required. Each benchmark is a subcommand; run with --help to list them.
+
+    python tools/plex-benchmark.py ingest --items 50000
+    python tools/plex-benchmark.py parsers --items 2000
+    python tools/plex-benchmark.py formats --items 2000
+    python tools/plex-benchmark.py importtime plexapi.server
+    python tools/plex-benchmark.py build --items 100000
+    python tools/plex-benchmark.py filters --items 50000
+    python tools/plex-benchmark.py section --items 10000
+    python tools/plex-benchmark.py children --items 5000
+"""
+import argparse
+import gzip
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+import zlib
+
+from plexapi import audio, compat, utils, video  # noqa: F401 (registers Movie, Track)
+from plexapi.base import PlexObject, _lazyItems
+from plexapi.exceptions import Unsupported
+from plexapi.parser import PARSERS, parseJson, setParser
+from plexapi.server import PlexServer
+from requests.models import Response
+
+MOVIE = ('<Video ratingKey="%(id)s" key="/library/metadata/%(id)s" guid="com.plexapp.agents.imdb://tt%(id)07d?lang=en" '
+    'librarySectionID="1" type="movie" title="Movie Title %(id)s" titleSort="Movie Title %(id)s" '
+    'contentRating="PG-13" summary="Synthetic summary for item %(id)s — café." rating="7.4" '
+    'year="2017" thumb="/library/metadata/%(id)s/thumb/1500000000" art="/library/metadata/%(id)s/art/1500000000" '
+    'duration="7200000" originallyAvailableAt="2017-01-01" addedAt="1500000000" updatedAt="1500000000">'
+    '<Media id="%(id)s" duration="7200000" bitrate="4000" width="1920" height="1080" aspectRatio="1.78" '
+    'audioChannels="6" audioCodec="ac3" videoCodec="h264" videoResolution="1080" container="mkv" '
+    'videoFrameRate="24p" videoProfile="high"><Part id="%(id)s" key="/library/parts/%(id)s/file.mkv" '
+    'duration="7200000" file="/media/movies/Movie Title %(id)s (2017).mkv" size="4000000000" container="mkv" '
+    'videoProfile="high"/></Media><Genre tag="Drama"/><Genre tag="Thriller"/><Director tag="Jane Doe"/>'
+    '<Writer tag="John Doe"/><Country tag="USA"/><Role tag="Actor %(id)s"/></Video>')
+TRACK = ('<Track ratingKey="%(id)s" key="/library/metadata/%(id)s" parentRatingKey="20" grandparentRatingKey="10" '
+    'guid="com.plexapp.agents.plexmusic://gracenote/track/%(id)s?lang=en" type="track" title="Track %(id)s" '
+    'grandparentKey="/library/metadata/10" parentKey="/library/metadata/20" librarySectionID="2" '
+    'grandparentTitle="Artist" parentTitle="Album" summary="" index="%(id)s" parentIndex="1" ratingCount="12" '
+    'thumb="/library/metadata/20/thumb/1500000000" parentThumb="/library/metadata/20/thumb/1500000000" '
+    'grandparentThumb="/library/metadata/10/thumb/1500000000" duration="240000" addedAt="1500000000" '
+    'updatedAt="1500000000"><Media id="%(id)s" duration="240000" bitrate="320" audioChannels="2" audioCodec="mp3" '
+    'container="mp3"><Part id="%(id)s" key="/library/parts/%(id)s/file.mp3" duration="240000" '
+    'file="/media/music/Artist/Album/%(id)s - Track %(id)s.mp3" size="9600000" container="mp3">'
+    '<Stream id="%(id)s" streamType="2" selected="1" codec="mp3" index="0" channels="2" bitrate="320" '
+    'bitrateMode="cbr" samplingRate="44100"/></Part></Media></Track>')
+
+# movie with the tags of a richly tagged library (cast, crew, collections, ..)
+RICHTAGS = (('Genre', 5), ('Director', 2), ('Writer', 4), ('Producer', 4), ('Country', 2), ('Collection', 2),
+    ('Label', 2), ('Role', 30))
+RICHMOVIE = MOVIE.replace('</Video>', ''.join('<%s id="%s" tag="%s %s" role="Character %s"/>' % (tag, 100 * n + i,
+    tag, i, i) for n, (tag, count) in enumerate(RICHTAGS) for i in range(count)) + '<Field name="title" locked="1"/>'
+    '<Field name="summary" locked="1"/></Video>')
+
+
+def container(items, template=MOVIE):
+    """ Returns the raw bytes of a synthetic /library/sections/1/all response with the
+        specified number of movies (or items of template). Charset is not declared in the
+        content-type header, matching what the Plex Media Server sends.
+    """
+    body = ''.join(template % {'id': i} for i in range(items))
+    body = ('<?xml version="1.0" encoding="UTF-8"?>\n<MediaContainer size="%s" allowSync="1" '
+        'librarySectionID="1" librarySectionTitle="Movies" viewGroup="movie">%s</MediaContainer>\n' % (items, body))
+    return body.encode('utf8')
+
+
+def tojson(elem, key=None):
+    """ Returns the JSON representation the Plex Media Server uses for the specified element:
+        attributes as values, children as lists keyed by tag and items listed under Metadata.
+    """
+    obj = dict(elem.attrib)
+    for child in elem:
+        tag = 'Metadata' if elem.tag == 'MediaContainer' else child.tag
+        obj.setdefault(tag, []).append(tojson(child))
+    return {elem.tag: obj} if elem.tag == 'MediaContainer' else obj
+
+
+def response(content):
+    """ Returns a requests.Response holding the specified body, as returned by session.get(). """
+    resp = Response()
+    resp.status_code = 200
+    resp.headers['Content-Type'] = 'application/xml'
+    resp._content = content
+    return resp
+
+
+def xmlroot(elem):
+    """ Returns the root element kept alive by elem (its document with lxml). """
+    return elem.getroottree().getroot() if hasattr(elem, 'getroottree') else elem
+
+
+def timeit(func, repeat):
+    """ Returns the best CPU time in seconds of calling func() repeat times. """
+    best = None
+    for _ in range(repeat):
+        start = time.process_time()
+        func()
+        elapsed = time.process_time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def ingest(opts):
+    """ Compare transfer size and CPU time of decoding the body to text before parsing
+        (response.text.encode) with parsing response.content directly.
+    """
+    content = container(opts.items)
+    print('Synthetic container: %s items' % opts.items)
+    print('  identity: %10s bytes' % len(content))
+    print('  deflate:  %10s bytes' % len(zlib.compress(content)))
+    print('  gzip:     %10s bytes' % len(gzip.compress(content)))
+    text = lambda: utils.parseXml(response(content).text.encode('utf8'))
+    raw = lambda: utils.parseXml(response(content).content)
+    gzipped = gzip.compress(content)
+    compressed = lambda: utils.parseXml(gzip.decompress(gzipped))
+    told, tnew, tgzip = timeit(text, opts.repeat), timeit(raw, opts.repeat), timeit(compressed, opts.repeat)
+    print('CPU time (best of %s):' % opts.repeat)
+    print('  response.text.encode: %.3fs' % told)
+    print('  response.content:     %.3fs (%.1fx)' % (tnew, told / tnew))
+    print('  gzip + content:       %.3fs' % tgzip)
+
+
+def parsers(opts):
+    """ Compare the XML parser backends (see plexapi.parser) parsing a synthetic container
+        and building the Movie objects from it.
+    """
+    content = container(opts.items)
+    print('Synthetic container: %s items, %s bytes' % (opts.items, len(content)))
+    print('CPU time (best of %s):   parse     build' % opts.repeat)
+    for name in sorted(PARSERS):
+        try:
+            backend = setParser(name)
+        except Unsupported as err:
+            print('  %-6s skipped: %s' % (name, err))
+            continue
+        data = backend.fromstring(content)
+        obj = PlexObject(None, None)
+        tparse = timeit(lambda: backend.fromstring(content), opts.repeat)
+        tbuild = timeit(lambda: obj.findItems(data), opts.repeat)
+        print('  %-22s %.3fs    %.3fs' % (name, tparse, tbuild))
+
+
+def formats(opts):
+    """ Compare XML and JSON responses (PlexServer format='json'), decoding a synthetic
+        container and building the Movie objects from it.
+    """
+    content = container(opts.items)
+    backend = setParser(opts.parser)
+    payload = json.dumps(tojson(backend.fromstring(content))).encode('utf8')
+    obj = PlexObject(None, None)
+    print('Synthetic container: %s items, xml %s bytes, json %s bytes' % (opts.items, len(content), len(payload)))
+    print('CPU time (best of %s):   decode    decode+build' % opts.repeat)
+    for name, parse, body in (('xml (%s)' % backend.name, backend.fromstring, content), ('json', parseJson, payload)):
+        tparse = timeit(lambda: parse(body), opts.repeat)
+        tbuild = timeit(lambda: obj.findItems(parse(body)), opts.repeat)
+        print('  %-22s %.3fs    %.3fs' % (name, tparse, tbuild))
+
+
+def build(opts):
+    """ Measure building Track objects (with their Media, MediaPart and streams) from a
+        synthetic container, then reading a few attributes of each, and the memory held by
+        the built objects on top of the parsed response, and when keeping only some of them
+        (with and without keep_xml).
+    """
+    backend = setParser(opts.parser)
+    data = backend.fromstring(container(opts.items, TRACK))
+    obj = PlexObject(None, None)
+    read = lambda items: [(i.title, i.ratingKey, i.duration) for i in items]
+    deep = lambda items: [s.codec for i in items for m in i.media for p in m.parts for s in p.streams]
+    tbuild = timeit(lambda: obj.findItems(data), opts.repeat)
+    items = obj.findItems(data)
+    tread, tdeep = timeit(lambda: read(items), 1), timeit(lambda: deep(items), 1)
+    tracemalloc.start()
+    items = obj.findItems(data)
+    read(items)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print('Synthetic container: %s tracks (%s parser)' % (opts.items, backend.name))
+    print('  build:                %.3fs (best of %s)' % (tbuild, opts.repeat))
+    print('  read 3 attrs:         %.3fs' % tread)
+    print('  read stream codecs:   %.3fs' % tdeep)
+    print('  memory (built+read):  %.1f MB' % (memory / 1048576.0))
+    # memory still held when keeping 1% of the items once the response is no longer referenced;
+    # lxml elements keep their whole document alive and are allocated outside the Python heap,
+    # so the number of XML elements still reachable is listed as well
+    content = container(opts.items, TRACK)
+    for keep in (True, False):
+        tracemalloc.start()
+        items = obj.findItems(backend.fromstring(content), keep_xml=keep)[::100]
+        deep(items)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        roots = {id(root): root for root in (xmlroot(i._data) for i in items if i._data is not None)}
+        elements = sum(len(list(root.iter())) for root in roots.values())
+        print('  keep 1%%, keep_xml=%-5s %.1f MB, %s elements alive' % (keep, memory / 1048576.0, elements))
+        items = roots = None
+
+
+def filters(opts):
+    """ Compare checking each element of a synthetic container against attribute filters
+        (as passed to findItems) with the filters compiled per element or once per call.
+    """
+    data = setParser(opts.parser).fromstring(container(opts.items))
+    obj = PlexObject(None, None)
+    print('Synthetic container: %s items' % opts.items)
+    print('CPU time (best of %s):                                         per element  compiled' % opts.repeat)
+    for kwargs in ({'type': 'movie', 'year__gte': 2000, 'genre__tag__icontains': 'thrill'},
+            {'title__icontains': 'title 1', 'Rating__gt': 7.0, 'etag': 'Video'}):
+        check = obj._compileFilter(**kwargs)
+        told = timeit(lambda: [elem for elem in data if obj._checkAttrs(elem, **kwargs)], opts.repeat)
+        tnew = timeit(lambda: [elem for elem in data if check(elem)], opts.repeat)
+        name = ', '.join('%s=%r' % item for item in sorted(kwargs.items()))
+        print('  %-60s %.3fs       %.3fs (%.1fx)' % (name, told, tnew, told / tnew))
+
+
+def section(opts):
+    """ Measure the memory held by a whole section of movies kept in RAM (built with
+        keep_xml=False, so every attribute is decoded and the XML freed), with and without
+        sharing the tag objects and interning the repeated strings.
+    """
+    content = container(opts.items)
+    backend = setParser(opts.parser)
+    intern = compat.intern
+    print('Synthetic container: %s movies (%s parser)' % (opts.items, backend.name))
+    try:
+        for shared in (False, True):
+            server = PlexServer(lazy=True, keep_xml=False)
+            if not shared:
+                server._tags = None
+                compat.intern = lambda value: value
+            tracemalloc.start()
+            items = PlexObject(server, None).findItems(backend.fromstring(content))
+            memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            tags = len({id(tag) for item in items for attr in ('genres', 'directors', 'writers', 'countries',
+                'roles') for tag in getattr(item, attr)})
+            print('  %-24s %.1f MB, %s tag objects' % ('shared and interned:' if shared else 'built per item:',
+                memory / 1048576.0, tags))
+            compat.intern = intern
+            items = None
+    finally:
+        compat.intern = intern
+
+
+def children(opts):
+    """ Compare building the child lists (media, genres, roles, ..) of richly tagged movies
+        by filtering their children again for each list, or routing each child to its list
+        in a single pass.
+    """
+    data = setParser(opts.parser).fromstring(container(opts.items, RICHMOVIE))
+    items = PlexObject(PlexServer(lazy=True), None).findItems(data)
+    attrs = [attr for name, attr in _lazyItems(video.Movie)]
+    perlist = lambda: [[item.listAttrs(item._data, attr.attr, etag=attr.etag) if attr.attr
+        else item.findItems(item._data, etag=attr.etag) for attr in attrs] for item in items]
+    onepass = lambda: [item._decodeItems(item._data, attrs) for item in items]
+    tperlist, tonepass = timeit(perlist, opts.repeat), timeit(onepass, opts.repeat)
+    print('Synthetic container: %s movies, %s children each, %s lists' % (opts.items, len(data[0]), len(attrs)))
+    print('CPU time (best of %s):' % opts.repeat)
+    print('  filtered per list:  %.3fs' % tperlist)
+    print('  single pass:        %.3fs (%.1fx)' % (tonepass, tperlist / tonepass))
+
+
+def importtime(opts):
+    """ Measure the cold-start import time of a module with python -X importtime and list the
+        slowest imports it pulls in (cumulative microseconds, best of repeat runs).
+    """
+    best = {}
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    for _ in range(opts.repeat):
+        cmd = [sys.executable, '-X', 'importtime', '-c', 'import %s' % opts.module]
+        output = subprocess.run(cmd, env=env, stderr=subprocess.PIPE, universal_newlines=True, check=True).stderr
+        for line in output.splitlines():
+            if line.startswith('import time:') and '|' in line and 'cumulative' not in line:
+                _, cumulative, name = line[12:].split('|')
+                name, cumulative = name.strip(), int(cumulative)
+                best[name] = min(best.get(name, cumulative), cumulative)
+    print('import %s: %.1fms (best of %s)' % (opts.module, best[opts.module] / 1000.0, opts.repeat))
+    for name, cumulative in sorted(best.items(), key=lambda item: -item[1])[1:opts.top + 1]:
+        print('  %8.1fms  %s' % (cumulative / 1000.0, name))
+    for name in ('platform', 'uuid', 'tqdm', 'websocket', 'plexapi.video', 'plexapi.audio', 'plexapi.photo'):
+        print('  %-14s %s' % (name, 'imported' if name in best else 'not imported'))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='benchmark')
+    subparsers.required = True
+    sub = subparsers.add_parser('ingest', help=ingest.__doc__.split('.')[0].strip())
+    sub.add_argument('--items', type=int, default=50000, help='Number of items in the container.')
+    sub.add_argument('--repeat', type=int, default=3, help='Number of runs to keep the best time of.')
+    sub.set_defaults(func=ingest)
+    sub = subparsers.add_parser('parsers', help=parsers.__doc__.split('(')[0].strip())
+    sub.add_argument('--items', type=int, default=2000, help='Number of items in the container.')
+    sub.add_argument('--repeat', type=int, default=3, help='Number of runs to keep the best time of.')
+    sub.set_defaults(func=parsers)
+    sub = subparsers.add_parser('formats', help=formats.__doc__.split('(')[0].strip())
+    sub.add_argument('--items', type=int, default=2000, help='Number of items in the container.')
+    sub.add_argument('--repeat', type=int, default=3, help='Number of runs to keep the best time of.')
+    sub.add_argument('--parser', default='etree', choices=sorted(PARSERS), help='XML parser to compare with.')
+    sub.set_defaults(func=formats)
+    sub = subparsers.add_parser('build', help=build.__doc__.split(' (')[0].strip())
+    sub.add_argument('--items', type=int, default=100000, help='Number of tracks in the container.')
+    sub.add_argument('--repeat', type=int, default=3, help='Number of runs to keep the best time of.')
+    sub.add_argument('--parser', default='etree', choices=sorted(PARSERS), help='XML parser to build from.')
+    sub.set_defaults(func=build)
+    sub = subparsers.add_parser('filters', help=filters.__doc__.split(' (')[0].strip())
+    sub.add_argument('--items', type=int, default=50000, help='Number of items in the container.')
+    sub.add_argument('--repeat', type=int, default=3, help='Number of runs to keep the best time of.')
+    sub.add_argument('--parser', default='etree', choices=sorted(PARSERS), help='XML parser to build from.')
+    sub.set_defaults(func=filters)
+    sub = subparsers.add_parser('section', help=section.__doc__.split(' (')[0].strip())
+    sub.add_argument('--items', type=int, default=10000, help='Number of movies in the container.')
+    sub.add_argument('--parser', default='etree', choices=sorted(PARSERS), help='XML parser to build from.')
+    sub.set_defaults(func=section)
+    sub = subparsers.add_parser('children', help=children.__doc__.split(' by')[0].strip())
+    sub.add_argument('--items', type=int, default=5000, help='Number of movies in the container.')
+    sub.add_argument('--repeat', type=int, default=3, help='Number of runs to keep the best time of.')
+    sub.add_argument('--parser', default='etree', choices=sorted(PARSERS), help='XML parser to build from.')
+    sub.set_defaults(func=children)
+    sub = subparsers.add_parser('importtime', help=importtime.__doc__.split(' with')[0].strip())
+    sub.add_argument('module', nargs='?', default='plexapi.server', help='Module to import.')
+    sub.add_argument('--repeat', type=int, default=5, help='Number of runs to keep the best time of.')
+    sub.add_argument('--top', type=int, default=15, help='Number of slowest imports to list.')
+    sub.set_defaults(func=importtime)
+    opts = parser.parse_args()
+    opts.func(opts)
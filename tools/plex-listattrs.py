@@ -222,6 +222,8 @@ class PlexAttributes():
         if isinstance(obj, PlexObject) and clsname not in DONT_RELOAD:
             self._safe_reload(obj)
         alldocs = '\n\n'.join(self._all_docs(obj.__class__))
+        if isinstance(obj, PlexObject):
+            obj._decodeAttrs()
         for attr, value in obj.__dict__.items():
             if value is None or isinstance(value, (str, bool, float, int, datetime)):
                 if not attr.startswith('_') and attr not in IGNORES.get(clsname, []):
@@ -22,6 +22,8 @@ class AttDS(object):
     def __init__(self, o, keys=None, style='google'):
         self.__o = o
         if not isinstance(o, dict):
+            if hasattr(o, '_decodeAttrs'):
+                o._decodeAttrs()  # PlexObject attributes are decoded when first read
             self.o = o.__dict__.items()
             self._as_dict = o.__dict__
         else: